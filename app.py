@@ -1,3 +1,4 @@
+import gc
 import os
 
 import streamlit as st
@@ -5,13 +6,10 @@ from dotenv import load_dotenv
 
 from src.config import GameConfig
 from src.game.service import GameService
-from src.quiz.adapters.db_manager import DatabaseManager
-from src.quiz.adapters.seeder import DataSeeder
-from src.quiz.adapters.sqlite_repository import SQLiteQuizRepository
-from src.quiz.adapters.supabase_repository import SupabaseQuizRepository
 from src.quiz.domain.ports import IQuizRepository
 from src.quiz.presentation.views import dashboard_view, question_view, summary_view
 from src.quiz.presentation.views.components import apply_styles
+from src.shared.telemetry import start_metrics_server
 
 # --- CONFIGURATION ---
 st.set_page_config(
@@ -21,7 +19,76 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-load_dotenv()
+
+@st.cache_resource
+def _load_env() -> bool:
+    """Parses .env once per process instead of on every rerun."""
+    return load_dotenv()
+
+
+_load_env()
+
+
+@st.cache_resource
+def get_repository() -> IQuizRepository:
+    """
+    Builds the repository once per process.
+    Streamlit re-executes this script on every interaction, so without the
+    cache each new session would re-open the DB and re-run schema checks.
+    """
+    # Adapters are imported here, not at module top: only the cached first
+    # call needs them, so reruns never touch these imports.
+    if GameConfig.USE_SQLITE:
+        from src.quiz.adapters.db_manager import DatabaseManager
+        from src.quiz.adapters.sqlite_repository import SQLiteQuizRepository
+
+        db_manager = DatabaseManager("data/quiz.db")
+        return SQLiteQuizRepository(db_manager)
+
+    # Imported lazily: the supabase client stack (httpx, postgrest, realtime)
+    # is heavy and only needed when SQLite is switched off.
+    from src.quiz.adapters.supabase_repository import SupabaseQuizRepository
+
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_KEY")
+
+    # Explicit check to satisfy MyPy
+    if url is None or key is None:
+        st.error("Missing Supabase Credentials")
+        st.stop()
+
+    # Now MyPy knows url and key are definitely strings
+    return SupabaseQuizRepository(url, key)
+
+
+@st.cache_resource
+def _seed_once(_repo: IQuizRepository) -> bool:
+    """
+    Seeds the (shared) repository once per process.
+    Later sessions skip the emptiness query entirely.
+    """
+    from src.quiz.adapters.seeder import DataSeeder
+
+    DataSeeder(_repo).seed_if_empty()
+    return True
+
+
+@st.cache_resource
+def _start_metrics_once() -> bool:
+    """Binds the Prometheus /metrics port once per process, never per rerun."""
+    return start_metrics_server()
+
+
+@st.cache_resource
+def _freeze_bootstrap_heap() -> bool:
+    """
+    Moves everything allocated during bootstrap (modules, repository, pool)
+    into the GC's permanent generation. Automatic GC stays on for the
+    short-lived rerun garbage, but full collections stop re-scanning the
+    long-lived startup objects.
+    """
+    gc.freeze()
+    return True
 
 
 def main() -> None:
@@ -29,26 +96,13 @@ def main() -> None:
 
     # --- 1. INITIALIZATION ---
     if "service" not in st.session_state:
-        repo: IQuizRepository
-        # Repo Setup
-        if GameConfig.USE_SQLITE:
-            db_manager = DatabaseManager("data/quiz.db")
-            repo = SQLiteQuizRepository(db_manager)
-        else:
-            url = os.getenv("SUPABASE_URL")
-            key = os.getenv("SUPABASE_KEY")
-
-            # Explicit check to satisfy MyPy
-            if url is None or key is None:
-                st.error("Missing Supabase Credentials")
-                st.stop()
-
-            # Now MyPy knows url and key are definitely strings
-            repo = SupabaseQuizRepository(url, key)
+        # Repo Setup (shared across sessions)
+        repo = get_repository()
 
-        # Seeding
-        seeder = DataSeeder(repo)
-        seeder.seed_if_empty()
+        # Seeding (once per process)
+        _seed_once(repo)
+        _start_metrics_once()
+        _freeze_bootstrap_heap()
 
         # --- DEMO LOGIC: Determine user_id BEFORE creating service ---
         query_params = st.query_params
@@ -70,7 +124,7 @@ def main() -> None:
         st.session_state.service = GameService(repo, user_id)
 
         # Routing Init
-        profile = repo.get_or_create_profile(user_id)
+        profile = st.session_state.service.profile_manager.get()
         if not profile.has_completed_onboarding:
             st.session_state.service.start_onboarding(user_id)
         else:
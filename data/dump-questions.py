@@ -1,4 +1,7 @@
-import json
+from json_io import dumps, loads
+
+# Fields kept in the dump, in output order
+KEYS = ("id", "text", "options", "hint", "category")
 
 
 def filter_json_fields(input_file: str, output_file: str) -> None:
@@ -10,24 +13,15 @@ def filter_json_fields(input_file: str, output_file: str) -> None:
         output_file: Path to output JSON file
     """
     # Read input JSON
-    with open(input_file, encoding="utf-8") as f:
-        data = json.load(f)
+    with open(input_file, "rb") as f:
+        data = loads(f.read())
 
     # Filter fields
-    filtered_data = []
-    for item in data:
-        filtered_item = {
-            "id": item.get("id"),
-            "text": item.get("text"),
-            "options": item.get("options"),
-            "hint": item.get("hint"),
-            "category": item.get("category"),
-        }
-        filtered_data.append(filtered_item)
+    filtered_data = [{key: item.get(key) for key in KEYS} for item in data]
 
     # Write output JSON
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(filtered_data, f, ensure_ascii=False, indent=2)
+    with open(output_file, "wb") as f:
+        f.write(dumps(filtered_data))
 
     print(f"Filtered {len(filtered_data)} items successfully!")
 
@@ -0,0 +1,21 @@
+"""JSON read/write helpers shared by the seed-data scripts in this folder."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # orjson is an optional speedup; stdlib writes the same JSON
+
+    def loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
@@ -0,0 +1,49 @@
+from json_io import dumps, loads
+from update_categories import apply_categories
+from update_hints import apply_hints
+
+
+def rebuild_seed(
+    seed_file_path: str,
+    category_mapping_path: str,
+    hint_mapping_path: str,
+    output_file_path: str,
+) -> None:
+    """
+    Applies the category and hint mappings in one pass over the seed:
+    the questions are parsed once and serialized once, instead of a
+    load/dump round trip per update script.
+    """
+    # 1. Load the seed data and both mappings
+    try:
+        with open(seed_file_path, "rb") as f:
+            questions = loads(f.read())
+        with open(category_mapping_path, "rb") as f:
+            category_map = loads(f.read())
+        with open(hint_mapping_path, "rb") as f:
+            hint_data = loads(f.read())
+    except FileNotFoundError as e:
+        print(f"Error: File {e.filename} not found.")
+        return
+
+    # 2. Update the question objects in memory
+    categorized = apply_categories(questions, category_map)
+    hinted = apply_hints(questions, hint_data)
+
+    # 3. Save once
+    with open(output_file_path, "wb") as f:
+        f.write(dumps(questions))
+
+    print(
+        f"Success! Categorized {categorized} and added hints to {hinted} "
+        f"questions. Saved to {output_file_path}"
+    )
+
+
+if __name__ == "__main__":
+    SEED_FILE = "seed_questions.json"
+    CATEGORY_MAPPING_FILE = "mapping_category.json"
+    HINT_MAPPING_FILE = "mapping_hints_long.json"
+    OUTPUT_FILE = "seed_questions_rebuilt.json"
+
+    rebuild_seed(SEED_FILE, CATEGORY_MAPPING_FILE, HINT_MAPPING_FILE, OUTPUT_FILE)
@@ -1,4 +1,34 @@
-import json
+from typing import Any
+
+from json_io import dumps, loads
+
+
+def apply_categories(
+    questions: list[dict[str, Any]], category_map: dict[str, Any]
+) -> int:
+    """Sets `category` on each question in place; returns how many were mapped."""
+    # Invert the mapping for O(1) lookup complexity
+    # Transforms: {"Category A": ["1", "2"]} -> {"1": "Category A", "2": "Category A"}
+    id_to_category = {
+        q_id: category for category, ids in category_map.items() for q_id in ids
+    }
+
+    # Questions without a mapping fall back to "Uncategorized"; they are
+    # reported once at the end instead of one print per ID.
+    missing = []
+    for question in questions:
+        q_id = question.get("id")
+        category = id_to_category.get(q_id)
+        if category is None:
+            category = "Uncategorized"
+            missing.append(q_id)
+        question["category"] = category
+
+    if missing:
+        print(f"Warning: {len(missing)} question IDs have no category mapping:")
+        print(", ".join(map(str, missing)))
+
+    return len(questions) - len(missing)
 
 
 def update_questions_with_categories(
@@ -6,42 +36,26 @@ def update_questions_with_categories(
 ) -> None:
     # 1. Load the seed data
     try:
-        with open(seed_file_path, encoding="utf-8") as f:
-            questions = json.load(f)
+        with open(seed_file_path, "rb") as f:
+            questions = loads(f.read())
     except FileNotFoundError:
         print(f"Error: File {seed_file_path} not found.")
         return
 
     # 2. Load the category mapping
     try:
-        with open(mapping_file_path, encoding="utf-8") as f:
-            category_map = json.load(f)
+        with open(mapping_file_path, "rb") as f:
+            category_map = loads(f.read())
     except FileNotFoundError:
         print(f"Error: File {mapping_file_path} not found.")
         return
 
-    # 3. Invert the mapping for O(1) lookup complexity
-    # Transforms: {"Category A": ["1", "2"]} -> {"1": "Category A", "2": "Category A"}
-    id_to_category = {}
-    for category, ids in category_map.items():
-        for q_id in ids:
-            id_to_category[q_id] = category
+    # 3. Update the question objects
+    updated_count = apply_categories(questions, category_map)
 
-    # 4. Update the question objects
-    updated_count = 0
-    for question in questions:
-        q_id = question.get("id")
-        if q_id in id_to_category:
-            question["category"] = id_to_category[q_id]
-            updated_count += 1
-        else:
-            # Optional: Handle questions without a category
-            question["category"] = "Uncategorized"
-            print(f"Warning: Question ID {q_id} has no category mapping.")
-
-    # 5. Save the updated JSON
-    with open(output_file_path, "w", encoding="utf-8") as f:
-        json.dump(questions, f, ensure_ascii=False, indent=2)
+    # 4. Save the updated JSON
+    with open(output_file_path, "wb") as f:
+        f.write(dumps(questions))
 
     print(f"Success! Updated {updated_count} questions. Saved to {output_file_path}")
 
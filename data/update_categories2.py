@@ -1,35 +1,45 @@
-import json
+from bisect import bisect_right
 
+from json_io import dumps, loads
+
+# Rozłączne przedziały ID (od, do włącznie) -> kategoria, posortowane po "od".
+# Tam, gdzie stare listy się nakładały (77-78, 183-216), wygrywają diagramy.
+RANGES: list[tuple[int, int, str]] = [
+    (1, 62, "przepisy"),
+    (67, 72, "przepisy"),
+    (73, 76, "budowa-techniczna"),
+    (77, 78, "diagramy"),
+    (79, 125, "budowa-techniczna"),
+    (127, 175, "budowa-techniczna"),
+    (179, 182, "budowa-techniczna"),
+    (183, 244, "diagramy"),
+]
+STARTS = [lo for lo, _, _ in RANGES]
 
-def update_categories_simple(file_path: str) -> None:
-    """Prosta wersja - nadpisuje oryginalny plik"""
 
-    mapping = {
-        "przepisy": list(range(1, 63)) + list(range(67, 73)),
-        "budowa-techniczna": list(range(73, 126))
-        + list(range(127, 176))
-        + list(range(179, 217)),
-        "diagramy": [77, 78] + list(range(183, 245)),
-    }
+def category_for(q_id: int) -> str | None:
+    """Wyszukiwanie binarne w przedziałach zamiast słownika wszystkich ID."""
+    i = bisect_right(STARTS, q_id) - 1
+    if i >= 0 and q_id <= RANGES[i][1]:
+        return RANGES[i][2]
+    return None
 
-    # Odwrotne mapowanie
-    id_map = {}
-    for cat, ids in mapping.items():
-        for id_ in ids:
-            id_map[id_] = cat
+
+def update_categories_simple(file_path: str) -> None:
+    """Prosta wersja - nadpisuje oryginalny plik"""
 
     # Wczytaj i aktualizuj
-    with open(file_path, encoding="utf-8") as f:
-        data = json.load(f)
+    with open(file_path, "rb") as f:
+        data = loads(f.read())
 
     for q in data:
-        q_id = int(q["id"])
-        if q_id in id_map:
-            q["category"] = id_map[q_id]
+        category = category_for(int(q["id"]))
+        if category is not None:
+            q["category"] = category
 
     # Zapisz
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(file_path, "wb") as f:
+        f.write(dumps(data))
 
     print("✓ Kategorie zaktualizowane!")
 
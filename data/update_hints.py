@@ -1,35 +1,19 @@
-import json
+from typing import Any
 
+from json_io import dumps, loads
 
-def update_questions_with_hints(
-    seed_file_path: str, mapping_file_path: str, output_file_path: str
-) -> None:
-    # 1. Load seed data
-    try:
-        with open(seed_file_path, encoding="utf-8") as f:
-            questions = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: File {seed_file_path} not found.")
-        return
 
-    # 2. Load hint mapping
-    try:
-        with open(mapping_file_path, encoding="utf-8") as f:
-            hint_data = json.load(f)
-            heuristics = hint_data["heuristics"]
-            mapping = hint_data["mapping"]
-    except FileNotFoundError:
-        print(f"Error: File {mapping_file_path} not found.")
-        return
+def apply_hints(questions: list[dict[str, Any]], hint_data: dict[str, Any]) -> int:
+    """Sets `hint` on each question in place; returns how many were mapped."""
+    heuristics = hint_data["heuristics"]
 
-    # 3. Create a lookup dictionary: question_id -> hint_text
+    # Lookup dictionary: question_id -> hint_text
     id_to_hint = {}
-    for key, question_ids in mapping.items():
+    for key, question_ids in hint_data["mapping"].items():
         hint_text = heuristics.get(key, "")
         for q_id in question_ids:
             id_to_hint[q_id] = hint_text
 
-    # 4. Update questions
     updated_count = 0
     for question in questions:
         q_id = question.get("id")
@@ -41,9 +25,34 @@ def update_questions_with_hints(
             # (should not happen if mapping is complete)
             question["hint"] = None
 
-    # 5. Save
-    with open(output_file_path, "w", encoding="utf-8") as f:
-        json.dump(questions, f, ensure_ascii=False, indent=2)
+    return updated_count
+
+
+def update_questions_with_hints(
+    seed_file_path: str, mapping_file_path: str, output_file_path: str
+) -> None:
+    # 1. Load seed data
+    try:
+        with open(seed_file_path, "rb") as f:
+            questions = loads(f.read())
+    except FileNotFoundError:
+        print(f"Error: File {seed_file_path} not found.")
+        return
+
+    # 2. Load hint mapping
+    try:
+        with open(mapping_file_path, "rb") as f:
+            hint_data = loads(f.read())
+    except FileNotFoundError:
+        print(f"Error: File {mapping_file_path} not found.")
+        return
+
+    # 3. Update questions
+    updated_count = apply_hints(questions, hint_data)
+
+    # 4. Save
+    with open(output_file_path, "wb") as f:
+        f.write(dumps(questions))
 
     print(
         f"Success! Added hints to {updated_count} questions. "
@@ -9,13 +9,15 @@
 from .dashboard import mobile_dashboard
 from .header import mobile_header
 from .hero import mobile_hero
-from .option import mobile_option
-from .result import mobile_result_row
+from .option import mobile_option, mobile_option_group
+from .result import mobile_result_group, mobile_result_row
 
 __all__ = [
     "mobile_header",
     "mobile_option",
+    "mobile_option_group",
     "mobile_result_row",
+    "mobile_result_group",
     "mobile_dashboard",
     "mobile_hero",
 ]
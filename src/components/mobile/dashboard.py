@@ -1,8 +1,10 @@
+from functools import lru_cache
+from html import escape
 from typing import Any
 
 import streamlit as st
 
-from src.components.mobile.shared import SHARED_CSS
+from src.components.mobile.shared import SHARED_CSS, minify_css, minify_js
 from src.config import GameConfig
 
 # -----------------------------------------------------------------------------
@@ -70,46 +72,87 @@ export default function(component) {
         setTriggerValue('action', {type: 'SPRINT', payload: null});
     };
 
-    data.categories.forEach(cat => {
-        const item = document.createElement('div');
-        item.className = 'cat-item card';
-        let badgeClass = 'badge-green-light';
-        let badgeText = Math.round(cat.progress * 100) + '%';
-        let iconHtml = `<div class="icon-box">${cat.icon}</div>`;
+    // Grid markup is prebuilt in Python: one parse instead of one per item
+    grid.innerHTML = data.gridHtml;
 
-        if (cat.progress >= 1.0) {
-            badgeClass = 'badge-green-solid';
-            badgeText = '100%';
+    // One delegated handler for every category card
+    grid.onclick = (event) => {
+        const item = event.target.closest('.cat-item');
+        if (item) {
+            setTriggerValue('action', {type: 'CATEGORY', payload: item.dataset.catId});
         }
-        const subText = cat.subtitle ? cat.subtitle : "MISSING DATA";
-
-        item.innerHTML = `
-            ${iconHtml}
-            <div class="content">
-                <div class="cat-title">${cat.name}</div>
-                <div class="cat-sub">${subText}</div>
-            </div>
-            <div class="badge ${badgeClass}">${badgeText}</div>
-        `;
-
-        item.onclick = () => {
-            const payloadId = cat.id || cat.name;
-            setTriggerValue('action', {type: 'CATEGORY', payload: payloadId});
-        };
-        grid.appendChild(item);
-    });
+    };
 }
 """
 
+# Sprint card labels depend only on config, so they are built once at import
+SPRINT_LABEL = "Start"
+SPRINT_SUB = f"{GameConfig.SPRINT_QUESTIONS} losowych pytań • ~15 mins"
+
 _mobile_dashboard_component = st.components.v2.component(
     "mobile_dashboard",
     html=DASHBOARD_HTML,
-    css=DASHBOARD_CSS,
-    js=DASHBOARD_JS,
+    css=minify_css(DASHBOARD_CSS),
+    js=minify_js(DASHBOARD_JS),
     isolate_styles=True,
 )
 
 
+# One category card; filled per row with already-escaped values
+_ITEM_HTML = (
+    '<div class="cat-item card" data-cat-id="{id}">'
+    '<div class="icon-box">{icon}</div>'
+    '<div class="content">'
+    '<div class="cat-title">{name}</div>'
+    '<div class="cat-sub">{subtitle}</div>'
+    "</div>"
+    '<div class="badge {badge_class}">{badge_text}</div>'
+    "</div>"
+)
+
+
+@lru_cache(maxsize=64)
+def _render_items_html(rows: tuple[tuple[str, str, str, str, float], ...]) -> str:
+    """Unchanged categories (the common rerun) reuse the previous markup."""
+    items = []
+    for cat_id, icon, name, subtitle, progress in rows:
+        # int(x + 0.5) matches JS Math.round for non-negative values
+        badge_class, badge_text = (
+            ("badge-green-solid", "100%")
+            if progress >= 1.0
+            else ("badge-green-light", f"{int(progress * 100 + 0.5)}%")
+        )
+        items.append(
+            _ITEM_HTML.format_map(
+                {
+                    "id": escape(cat_id),
+                    "icon": escape(icon),
+                    "name": escape(name),
+                    "subtitle": escape(subtitle),
+                    "badge_class": badge_class,
+                    "badge_text": badge_text,
+                }
+            )
+        )
+    return "".join(items)
+
+
+def _grid_html(categories: list[dict[str, Any]]) -> str:
+    """Builds the category grid markup, escaping all text."""
+    return _render_items_html(
+        tuple(
+            (
+                str(cat.get("id") or cat.get("name", "")),
+                str(cat.get("icon", "")),
+                str(cat.get("name", "")),
+                cat.get("subtitle") or "MISSING DATA",
+                cat.get("progress", 0),
+            )
+            for cat in categories
+        )
+    )
+
+
 def mobile_dashboard(
     categories: list[dict[str, Any]], current_lang: str = "pl", key: str | None = None
 ) -> dict[str, Any] | None:
@@ -117,21 +160,18 @@ def mobile_dashboard(
     Renders the dashboard grid and settings.
     Returns: {'type': 'SPRINT'|'CATEGORY'|'LANGUAGE', 'payload': ...}
     """
-    sprint_count = GameConfig.SPRINT_QUESTIONS
-
     # 1. Render the React/Custom Component for the Grid
     result = _mobile_dashboard_component(
         data={
-            "categories": categories,
-            "sprintLabel": "Start",
-            "sprintSub": f"{sprint_count} losowych pytań • ~15 mins",
+            "gridHtml": _grid_html(categories),
+            "sprintLabel": SPRINT_LABEL,
+            "sprintSub": SPRINT_SUB,
         },
         key=key,
         on_action_change=lambda: None,
     )
 
     # CHECK 2: Grid Action
-    if result.action is not None:
-        return dict(result.action)
-
-    return None
+    # The trigger value is already a plain dict decoded from JSON; no copy needed
+    action: dict[str, Any] | None = result.action
+    return action
@@ -1,6 +1,6 @@
 import streamlit as st
 
-from src.components.mobile.shared import SHARED_CSS
+from src.components.mobile.shared import SHARED_CSS, minify_css, minify_js
 
 HEADER_HTML = """
 <div class="container">
@@ -129,7 +129,11 @@ export default function(component) {
 """
 
 _mobile_header_component = st.components.v2.component(
-    "mobile_header", html=HEADER_HTML, css=HEADER_CSS, js=HEADER_JS, isolate_styles=True
+    "mobile_header",
+    html=HEADER_HTML,
+    css=minify_css(HEADER_CSS),
+    js=minify_js(HEADER_JS),
+    isolate_styles=True,
 )
 
 
@@ -1,6 +1,6 @@
 import streamlit as st
 
-from src.components.mobile.shared import SHARED_CSS
+from src.components.mobile.shared import SHARED_CSS, minify_css, minify_js
 
 HERO_HTML = """
 <div class="hero-compact">
@@ -196,7 +196,11 @@ export default function(component) {
 """
 
 _mobile_hero_component = st.components.v2.component(
-    "mobile_hero", html=HERO_HTML, css=HERO_CSS, js=HERO_JS, isolate_styles=True
+    "mobile_hero",
+    html=HERO_HTML,
+    css=minify_css(HERO_CSS),
+    js=minify_js(HERO_JS),
+    isolate_styles=True,
 )
 
 
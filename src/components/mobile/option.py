@@ -1,6 +1,6 @@
 import streamlit as st
 
-from src.components.mobile.shared import SHARED_CSS
+from src.components.mobile.shared import SHARED_CSS, minify_css, minify_js
 
 OPTION_HTML = """
 <button id="btn" class="option-card">
@@ -74,7 +74,11 @@ export default function(component) {
 """
 
 _mobile_option_component = st.components.v2.component(
-    "mobile_option", html=OPTION_HTML, css=OPTION_CSS, js=OPTION_JS, isolate_styles=True
+    "mobile_option",
+    html=OPTION_HTML,
+    css=minify_css(OPTION_CSS),
+    js=minify_js(OPTION_JS),
+    isolate_styles=True,
 )
 
 
@@ -87,3 +91,80 @@ def mobile_option(key_char: str, text: str, key: str | None = None) -> str | Non
     )
     clicked = result.clicked
     return str(clicked) if clicked is not None else None
+
+
+# -----------------------------------------------------------------------------
+# OPTION GROUP: all answers of a question in ONE component instance
+# -----------------------------------------------------------------------------
+
+OPTION_GROUP_HTML = """
+<div id="options" class="option-group"></div>
+"""
+
+OPTION_GROUP_CSS = (
+    OPTION_CSS
+    + """
+.option-group {
+    display: flex;
+    flex-direction: column;
+    gap: 8px;
+}
+"""
+)
+
+OPTION_GROUP_JS = """
+export default function(component) {
+    const { data, setTriggerValue, parentElement } = component;
+    const list = parentElement.querySelector('#options');
+
+    // 1. Populate (textContent keeps option text un-parsed)
+    list.replaceChildren(...data.options.map(opt => {
+        const btn = document.createElement('button');
+        btn.className = 'option-card';
+        btn.dataset.key = opt.key;
+
+        const badge = document.createElement('div');
+        badge.className = 'badge';
+        badge.textContent = opt.key;
+
+        const text = document.createElement('div');
+        text.className = 'text';
+        text.textContent = opt.text;
+
+        btn.append(badge, text);
+        return btn;
+    }));
+
+    // 2. One delegated click handler for every option
+    list.onclick = (event) => {
+        const btn = event.target.closest('.option-card');
+        if (btn) {
+            setTriggerValue('clicked', btn.dataset.key);
+        }
+    };
+}
+"""
+
+_mobile_option_group_component = st.components.v2.component(
+    "mobile_option_group",
+    html=OPTION_GROUP_HTML,
+    css=minify_css(OPTION_GROUP_CSS),
+    js=minify_js(OPTION_GROUP_JS),
+    isolate_styles=True,
+)
+
+
+def mobile_option_group(
+    options: list[tuple[str, str]], key: str | None = None
+) -> str | None:
+    """
+    Renders every answer option in a single component.
+    Returns the key_char (e.g. 'A') of the clicked option, if any.
+    """
+    result = _mobile_option_group_component(
+        data={"options": [{"key": k, "text": t} for k, t in options]},
+        key=key,
+        on_clicked_change=lambda: None,
+    )
+    clicked = result.clicked
+    return str(clicked) if clicked is not None else None
@@ -1,6 +1,6 @@
 import streamlit as st
 
-from src.components.mobile.shared import SHARED_CSS
+from src.components.mobile.shared import SHARED_CSS, minify_css, minify_js
 
 RESULT_HTML = """
 <div id="card" class="result-card">
@@ -115,7 +115,11 @@ export default function(component) {
 """
 
 _mobile_result_component = st.components.v2.component(
-    "mobile_result", html=RESULT_HTML, css=RESULT_CSS, js=RESULT_JS, isolate_styles=True
+    "mobile_result",
+    html=RESULT_HTML,
+    css=minify_css(RESULT_CSS),
+    js=minify_js(RESULT_JS),
+    isolate_styles=True,
 )
 
 
@@ -129,3 +133,76 @@ def mobile_result_row(
     _mobile_result_component(
         data={"key": key_char, "text": text, "state": state}, key=key
     )
+
+
+# -----------------------------------------------------------------------------
+# RESULT GROUP: all feedback rows of a question in ONE component instance
+# -----------------------------------------------------------------------------
+
+RESULT_GROUP_HTML = """
+<div id="rows" class="result-group"></div>
+"""
+
+RESULT_GROUP_CSS = (
+    RESULT_CSS
+    + """
+.result-group {
+    display: flex;
+    flex-direction: column;
+    gap: 8px;
+}
+"""
+)
+
+RESULT_GROUP_JS = """
+const ICONS = { correct: '✅', wrong: '❌', missed: '👈' };
+
+export default function(component) {
+    const { data, parentElement } = component;
+    const list = parentElement.querySelector('#rows');
+
+    list.replaceChildren(...data.rows.map(row => {
+        const card = document.createElement('div');
+        card.className = 'result-card';
+        if (row.state in ICONS) {
+            card.classList.add(row.state);
+        }
+
+        const badge = document.createElement('div');
+        badge.className = 'badge';
+        badge.textContent = row.key;
+
+        const text = document.createElement('div');
+        text.className = 'text';
+        text.textContent = row.text;
+
+        const icon = document.createElement('div');
+        icon.className = 'status-icon';
+        icon.textContent = ICONS[row.state] || '';
+
+        card.append(badge, text, icon);
+        return card;
+    }));
+}
+"""
+
+_mobile_result_group_component = st.components.v2.component(
+    "mobile_result_group",
+    html=RESULT_GROUP_HTML,
+    css=minify_css(RESULT_GROUP_CSS),
+    js=minify_js(RESULT_GROUP_JS),
+    isolate_styles=True,
+)
+
+
+def mobile_result_group(
+    rows: list[tuple[str, str, str]], key: str | None = None
+) -> None:
+    """
+    Renders every read-only result row in a single component.
+    rows: (key_char, text, state) with state as in `mobile_result_row`.
+    """
+    _mobile_result_group_component(
+        data={"rows": [{"key": k, "text": t, "state": s} for k, t, s in rows]},
+        key=key,
+    )
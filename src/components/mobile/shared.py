@@ -7,6 +7,8 @@
 # self-contained and easier to distribute as a Python package.
 # ---------------------------------------------------
 
+import re
+
 # We use :host to ensure the root container has no extra space
 SHARED_CSS = """
 /* 1. Import the Font inside the component iframe */
@@ -51,3 +53,36 @@ SHARED_CSS = """
     }
 }
 """
+
+# --- Import-time minification ---
+# Component CSS/JS is written for humans (comments, indentation) but is sent
+# to the browser with every component mount. Each component minifies its
+# strings once at registration, so the readable source stays as is.
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+# Only the space *after* a colon: "a :hover" is a different selector than
+# "a:hover", while "color: red" and "color:red" are the same declaration.
+_CSS_COLON = re.compile(r":\s+")
+
+
+def minify_css(css: str) -> str:
+    """
+    Strips comments and collapses whitespace around CSS punctuation.
+    Keeps one rule per line: Streamlit treats a single-line css string as a
+    file path rather than inline content.
+    """
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_WHITESPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION.sub(r"\1", css)
+    return _CSS_COLON.sub(":", css).replace("}", "}\n").strip()
+
+
+def minify_js(js: str) -> str:
+    """
+    Drops indentation, blank lines and whole-line `//` comments.
+    Line breaks are kept, so automatic semicolon insertion is unaffected.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
@@ -1,6 +1,7 @@
 import base64
 import os
 from enum import Enum
+from functools import lru_cache
 from typing import Final
 
 
@@ -20,10 +21,7 @@ class Category(Enum):
     @classmethod
     def get_icon(cls, label: str) -> str:
         """Returns the icon for a given category label, or a default."""
-        for category in cls:
-            if category.label == label:
-                return category.icon
-        return "🔨"  # Default fallback
+        return _ICONS_BY_LABEL.get(label, "🔨")  # Default fallback
 
     @classmethod
     def all_labels(cls) -> list[str]:
@@ -31,6 +29,43 @@ class Category(Enum):
         return [c.label for c in cls]
 
 
+# Label -> icon, built once: get_icon runs for every category on each dashboard
+_ICONS_BY_LABEL: Final[dict[str, str]] = {c.label: c.icon for c in Category}
+
+
+@lru_cache(maxsize=256)
+def _logo_exists(path: str) -> bool:
+    """Logo assets ship with the app, so stat() each path only once."""
+    return os.path.exists(path)
+
+
+# Data URI prefix per image extension; anything else is served as PNG
+_IMAGE_MIME_TYPES: Final[dict[str, str]] = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".svg": "image/svg+xml",
+}
+
+# 1x1 transparent pixel, shown when a logo file is missing or unreadable
+_FALLBACK_IMAGE_URI: Final[str] = (
+    "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+
+@lru_cache(maxsize=64)
+def _image_data_uri(path: str) -> str:
+    """Logo files never change at runtime, so each one is encoded only once."""
+    try:
+        with open(path, "rb") as img_file:
+            b64_data = base64.b64encode(img_file.read()).decode("ascii")
+    except OSError as e:
+        print(f"Could not read image '{path}': {e}")
+        return _FALLBACK_IMAGE_URI
+
+    mime = _IMAGE_MIME_TYPES.get(os.path.splitext(path)[1].lower(), "image/png")
+    return f"data:{mime};base64,{b64_data}"
+
+
 class GameConfig:
     # --- Infrastructure Switch ---
     USE_SQLITE: bool = os.getenv("USE_SQLITE", "true").lower() in ("true", "1", "yes")
@@ -65,7 +100,7 @@ class GameConfig:
         safe_slug = "".join(c for c in prospect_slug if c.isalnum() or c in "_-")
         path = f"assets/logos/{safe_slug}.png"
 
-        if not os.path.exists(path):
+        if not _logo_exists(path):
             return GameConfig.APP_LOGO_PATH
         return path
 
@@ -75,43 +110,9 @@ class GameConfig:
         Converts a local image path to a Base64 Data URI for HTML embedding.
         Handles both local paths and web URLs.
         """
-        # Debug Log 1: What are we trying to load?
-        print(f"DEBUG: get_image_base64 called with path: '{path}'")
-
         # 1. Pass through web URLs
         if path.startswith("http"):
-            print("DEBUG: Path is a URL. Passing through.")
             return path
 
-        # 2. Convert local file
-        # Debug Log 2: Check absolute path to verify CWD (Current Working Directory)
-        abs_path = os.path.abspath(path)
-        print(f"DEBUG: Absolute path resolved to: '{abs_path}'")
-
-        if os.path.exists(path):
-            try:
-                print("DEBUG: File exists. Attempting to read...")
-                with open(path, "rb") as img_file:
-                    b64_data = base64.b64encode(img_file.read()).decode("utf-8")
-
-                    # Determine mime type
-                    mime = "image/png"
-                    lower_path = path.lower()
-                    if lower_path.endswith(".jpg") or lower_path.endswith(".jpeg"):
-                        mime = "image/jpeg"
-                    elif lower_path.endswith(".svg"):
-                        mime = "image/svg+xml"
-
-                    print(
-                        f"DEBUG: Success! Generated Base64 string (len={len(b64_data)})"
-                    )
-                    return f"data:{mime};base64,{b64_data}"
-            except Exception as e:
-                print(f"DEBUG: Error reading file: {e}")
-                pass  # Fallback below
-        else:
-            print("DEBUG: File NOT found at path.")
-
-        # 3. Fallback (Transparent pixel)
-        print("DEBUG: Returning Fallback 1x1 Pixel.")
-        return "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+        # 2. Convert local file (read and encoded once per process)
+        return _image_data_uri(path)
@@ -0,0 +1,90 @@
+import streamlit as st
+
+from src.quiz.domain.models import Question, QuestionCandidate
+from src.quiz.domain.ports import IQuizRepository
+
+# --- ADR 009: Revision-Keyed Query Cache ---
+# Decision: Read-heavy repository queries are wrapped in `st.cache_data`,
+# keyed on a per-user revision counter that is bumped after every write.
+# Rationale: Streamlit re-executes the script on every interaction, so the
+# same SELECTs run over and over while the underlying data is unchanged.
+# The revision lives in `st.cache_resource` (one dict per process) rather
+# than in session state, so a write in one session invalidates the cached
+# reads of every other session of the same user.
+# ---------------------------------------------
+
+
+@st.cache_resource
+def _revisions() -> dict[str, int]:
+    """Process-wide write counter per user."""
+    return {}
+
+
+def get_revision(user_id: str) -> int:
+    return _revisions().get(user_id, 0)
+
+
+def bump_revision(user_id: str) -> None:
+    """Invalidates every cached read for this user. Call after each write."""
+    revisions = _revisions()
+    revisions[user_id] = revisions.get(user_id, 0) + 1
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _repetition_candidates(
+    _repo: IQuizRepository, repo_id: int, user_id: str, revision: int
+) -> list[QuestionCandidate]:
+    return _repo.get_repetition_candidates(user_id)
+
+
+def get_repetition_candidates(
+    repo: IQuizRepository, user_id: str
+) -> list[QuestionCandidate]:
+    """Cached `repo.get_repetition_candidates` (see ADR 009)."""
+    return _repetition_candidates(repo, id(repo), user_id, get_revision(user_id))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _category_candidates(
+    _repo: IQuizRepository, repo_id: int, category: str, user_id: str, revision: int
+) -> list[tuple[Question, int]]:
+    return _repo.get_category_candidates(category, user_id)
+
+
+def get_category_candidates(
+    repo: IQuizRepository, category: str, user_id: str
+) -> list[tuple[Question, int]]:
+    """
+    Cached `repo.get_category_candidates` (see ADR 009).
+    Only the raw rows are cached: the randomized ordering is applied by the
+    caller on every start, so re-entering a category still reshuffles ties.
+    """
+    return _category_candidates(
+        repo, id(repo), category, user_id, get_revision(user_id)
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _mastery_percentage(
+    _repo: IQuizRepository, repo_id: int, user_id: str, category: str, revision: int
+) -> float:
+    return _repo.get_mastery_percentage(user_id, category)
+
+
+def get_mastery_percentage(repo: IQuizRepository, user_id: str, category: str) -> float:
+    """Cached `repo.get_mastery_percentage` (see ADR 009)."""
+    return _mastery_percentage(repo, id(repo), user_id, category, get_revision(user_id))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _category_stats(
+    _repo: IQuizRepository, repo_id: int, user_id: str, revision: int
+) -> list[dict[str, int | str]]:
+    return _repo.get_category_stats(user_id)
+
+
+def get_category_stats(
+    repo: IQuizRepository, user_id: str
+) -> list[dict[str, int | str]]:
+    """Cached `repo.get_category_stats` (see ADR 009)."""
+    return _category_stats(repo, id(repo), user_id, get_revision(user_id))
@@ -1,17 +1,49 @@
-import math
 from datetime import date, timedelta
 from typing import Any
 
 import streamlit as st
 
 from src.config import Category, GameConfig
-from src.quiz.domain.models import Language, Question
+from src.game import query_cache
+from src.quiz.domain.category_selector import CategorySelector
+from src.quiz.domain.models import Language, Question, QuizSession
 from src.quiz.domain.ports import IQuizRepository
 from src.quiz.domain.profile_manager import ProfileManager
 from src.quiz.domain.spaced_repetition import SpacedRepetitionSelector
 from src.shared.telemetry import Telemetry
 
 
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _build_category_payload(
+    rows: tuple[tuple[str, int, int], ...],
+) -> tuple[int, int, list[dict[str, Any]]]:
+    """
+    Pure (category, total, mastered) rows -> totals and category cards.
+    Cached on the row values, so dashboard reruns with unchanged stats reuse it.
+    """
+    # One pass: totals are accumulated while the category cards are built
+    total_q = total_mastered = 0
+    cat_data = []
+    for full_name, c_total, c_mastered in rows:
+        total_q += c_total
+        total_mastered += c_mastered
+        c_icon = Category.get_icon(full_name)
+        display_name = full_name
+        if len(display_name) > 30:
+            display_name = display_name[:28] + "..."
+
+        cat_data.append(
+            {
+                "id": full_name,
+                "name": display_name,
+                "progress": c_mastered / c_total if c_total > 0 else 0,
+                "icon": c_icon,
+                "subtitle": f"{c_mastered} / {c_total} Zrobione",
+            }
+        )
+    return total_q, total_mastered, cat_data
+
+
 class GameService:
     def __init__(self, repo: IQuizRepository, user_id: str):
         self.repo = repo
@@ -26,15 +58,13 @@ class GameService:
 
     def _reset_quiz_state(self, questions: list[Question], title: str) -> None:
         """Resets session state variables for a new quiz."""
-        st.session_state.quiz_questions = questions
-        st.session_state.quiz_title = title
-        st.session_state.current_index = 0
-        st.session_state.score = 0
-        st.session_state.answers_history = []  # List[bool]
-        st.session_state.screen = "quiz"
-        st.session_state.feedback_mode = False
-        st.session_state.last_feedback = None
-        st.session_state.quiz_errors = []  # Track IDs of failed questions
+        # All quiz progress lives in one QuizSession; the proxy is touched twice
+        st.session_state.update(
+            {
+                "quiz": QuizSession(questions=tuple(questions), title=title),
+                "screen": "quiz",
+            }
+        )
 
     # --- Dashboard Logic ---
 
@@ -42,38 +72,21 @@ class GameService:
         self, user_id: str, demo_slug: str | None = None
     ) -> dict[str, Any]:
         """Calculates all data needed for the Dashboard view."""
-        stats = self.repo.get_category_stats(user_id)
-        profile = self.repo.get_or_create_profile(user_id)
+        stats = query_cache.get_category_stats(self.repo, user_id)
+        profile = self.profile_manager.get()
 
-        total_q = sum(int(s["total"]) for s in stats)
-        total_mastered = sum(int(s["mastered"]) for s in stats)
+        # Hashable snapshot of the rows; unchanged stats skip the loops below
+        rows = tuple(
+            (str(s["category"]), int(s["total"]), int(s["mastered"])) for s in stats
+        )
+        total_q, total_mastered, cat_data = _build_category_payload(rows)
         remaining = total_q - total_mastered
 
         throughput = GameConfig.SPRINT_QUESTIONS
-        days_left = math.ceil(remaining / throughput) if remaining > 0 else 0
+        days_left = -(-remaining // throughput) if remaining > 0 else 0
         finish_date = date.today() + timedelta(days=days_left)
         global_progress = (total_mastered / total_q) if total_q > 0 else 0.0
 
-        # Prepare Category Data for UI
-        cat_data = []
-        for stat in stats:
-            full_name = str(stat["category"])
-            c_total = int(stat["total"])
-            c_mastered = int(stat["mastered"])
-            c_icon = Category.get_icon(full_name)
-            display_name = full_name
-            if len(display_name) > 30:
-                display_name = display_name[:28] + "..."
-
-            cat_data.append(
-                {
-                    "id": full_name,
-                    "name": display_name,
-                    "progress": c_mastered / c_total if c_total > 0 else 0,
-                    "icon": c_icon,
-                    "subtitle": f"{c_mastered} / {c_total} Zrobione",
-                }
-            )
         # Determine which logo to show
         if demo_slug:
             logo_path = GameConfig.get_demo_logo_path(demo_slug)
@@ -98,7 +111,7 @@ class GameService:
     # --- Game Actions ---
 
     def start_daily_sprint(self, user_id: str) -> None:
-        candidates = self.repo.get_repetition_candidates(user_id)
+        candidates = query_cache.get_repetition_candidates(self.repo, user_id)
         questions = self.selector.select(candidates, limit=GameConfig.SPRINT_QUESTIONS)
 
         if not questions:
@@ -109,8 +122,9 @@ class GameService:
         st.rerun()
 
     def start_category_mode(self, user_id: str, category: str) -> None:
-        questions = self.repo.get_questions_by_category(
-            category, user_id, limit=GameConfig.SPRINT_QUESTIONS
+        candidates = query_cache.get_category_candidates(self.repo, category, user_id)
+        questions = CategorySelector.prioritize_weak_questions(
+            candidates, limit=GameConfig.SPRINT_QUESTIONS
         )
 
         if not questions:
@@ -149,40 +163,45 @@ class GameService:
 
         # 1. Update DB
         self.repo.save_attempt(user_id, question.id, is_correct)
+        query_cache.bump_revision(user_id)
 
         # 2. Update Session
+        quiz: QuizSession = st.session_state.quiz
         if is_correct:
-            st.session_state.score += 1
+            quiz.score += 1
         else:
-            st.session_state.quiz_errors.append(question.id)
+            quiz.errors.append(question.id)
 
         # 3. NEW: Update daily progress via manager
         self.profile_manager.increment_daily_progress()
 
-        st.session_state.answers_history.append(is_correct)
-        st.session_state.feedback_mode = True
-        st.session_state.last_feedback = {
+        quiz.answers_history.append(is_correct)
+        quiz.feedback_mode = True
+        quiz.last_feedback = {
             "is_correct": is_correct,
             "selected": selected_option,
             "correct_option": question.correct_option,
         }
 
     def next_question(self) -> None:
-        st.session_state.current_index += 1
-        st.session_state.feedback_mode = False
-        st.session_state.last_feedback = None
+        quiz: QuizSession = st.session_state.quiz
+        quiz.current_index += 1
+        quiz.feedback_mode = False
+        quiz.last_feedback = None
 
         # Check if quiz is finished
-        if st.session_state.current_index >= len(st.session_state.quiz_questions):
+        if quiz.current_index >= len(quiz.questions):
             st.session_state.screen = "summary"
 
     def update_language(self, user_id: str, new_lang: str) -> None:
-        # Use manager instead of direct repo call
-        self.profile_manager.update_language(Language(new_lang))
+        lang = Language(new_lang)
+        # Re-selecting the current language is a no-op: skip the rerun
+        if self.profile_manager.get().preferred_language == lang:
+            return
 
-        # Force update the UI cache so the new language shows immediately
-        if "cached_profile" in st.session_state:
-            st.session_state.cached_profile.preferred_language = Language(new_lang)
+        # Use manager instead of direct repo call. It mutates the
+        # session-cached profile, so the new language shows immediately.
+        self.profile_manager.update_language(lang)
 
         st.rerun()
 
@@ -1,5 +1,9 @@
 import os
+import queue
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from src.shared.telemetry import Telemetry, measure_time
@@ -12,12 +16,27 @@ class DatabaseManager:
     2. Initializing the database schema (DDL).
     3. Handling migrations.
     4. Ensuring pickle-safety for Streamlit Session State.
+    5. Pooling long-lived connections for the repository (see acquire()).
     """
 
-    def __init__(self, db_path: str = "data/quiz.db") -> None:
+    # Applied to every file-backed connection when it is opened.
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-20000",
+    )
+
+    def __init__(self, db_path: str = "data/quiz.db", pool_size: int = 4) -> None:
         self.db_path = db_path
+        # An in-memory DB only exists inside its one connection
+        self.pool_size = 1 if db_path == ":memory:" else max(1, pool_size)
         self.telemetry = Telemetry("DatabaseManager")
         self._shared_connection: sqlite3.Connection | None = None
+        self._pool: queue.LifoQueue[sqlite3.Connection] | None = None
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
 
         self._ensure_db_exists()
 
@@ -37,9 +56,9 @@ class DatabaseManager:
         We must remove the SQLite connection object because it cannot be pickled.
         """
         state = self.__dict__.copy()
-        # Remove the unpickleable connection object
-        if "_shared_connection" in state:
-            del state["_shared_connection"]
+        # Remove the unpickleable connection object (and the pool holding more)
+        for attr in ("_shared_connection", "_pool", "_pool_lock", "_local"):
+            state.pop(attr, None)
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
@@ -50,6 +69,9 @@ class DatabaseManager:
         """
         self.__dict__.update(state)
         self._shared_connection = None
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
         # Note: If using ":memory:", data is lost here.
         # This architecture assumes file-based SQLite for persistence.
 
@@ -65,21 +87,71 @@ class DatabaseManager:
                 # Connection was closed externally
                 self._shared_connection = None
 
-        # Create new connection
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-
-        # Optimization: Enable WAL mode for better concurrency
-        if self.db_path != ":memory:":
-            conn.execute("PRAGMA journal_mode=WAL")
-
+        conn = self._connect()
         self._shared_connection = conn
         return conn
 
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrows a connection from the pool for the duration of the block.
+        Nested calls on the same thread get the connection already held,
+        so repository methods may call each other without deadlocking.
+        An exception inside the block rolls back any open transaction.
+        """
+        held: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if held is not None:
+            yield held
+            return
+
+        pool = self._get_pool()
+        conn = pool.get()
+        self._local.conn = conn
+        try:
+            yield conn
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            pool.put(conn)
+
     def close(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                while not self._pool.empty():
+                    pooled = self._pool.get_nowait()
+                    if pooled is not self._shared_connection:
+                        pooled.close()
+                self._pool = None
         if self._shared_connection:
             self._shared_connection.close()
             self._shared_connection = None
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+
+        # Optimization: WAL + relaxed fsync for better concurrency
+        if self.db_path != ":memory:":
+            for pragma in self.PRAGMAS:
+                conn.execute(pragma)
+
+        return conn
+
+    def _get_pool(self) -> "queue.LifoQueue[sqlite3.Connection]":
+        """Lazily opens the pool; the shared connection is its first member."""
+        with self._pool_lock:
+            if self._pool is None:
+                pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(
+                    maxsize=self.pool_size
+                )
+                pool.put(self.get_connection())
+                for _ in range(self.pool_size - 1):
+                    pool.put(self._connect())
+                self._pool = pool
+            return self._pool
+
     def _ensure_db_exists(self) -> None:
         if self.db_path == ":memory:":
             return
@@ -108,6 +180,13 @@ class DatabaseManager:
                 """
             )
 
+            # Category filters (category mode, mastery, dashboard stats).
+            # Mirrors idx_questions_category in the Supabase schema.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_questions_category "
+                "ON questions (category)"
+            )
+
             # User Progress Table
             conn.execute(
                 """
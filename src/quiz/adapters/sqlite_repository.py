@@ -15,22 +15,16 @@ class SQLiteQuizRepository(IQuizRepository):
         self.telemetry = Telemetry("SQLiteRepository")
         self.db_manager = db_manager
 
-    def _get_connection(self) -> sqlite3.Connection:
-        return self.db_manager.get_connection()
-
     def is_empty(self) -> bool:
         """Helper for the Seeder."""
-        conn = self._get_connection()
-        cursor = conn.execute("SELECT count(*) FROM questions")
-        result = cursor.fetchone()
-        count = result[0] if result else 0
-        if not self.db_manager._shared_connection:
-            conn.close()
-        return count == 0
+        with self.db_manager.acquire() as conn:
+            # EXISTS stops at the first row instead of counting the table
+            cursor = conn.execute("SELECT EXISTS(SELECT 1 FROM questions)")
+            result = cursor.fetchone()
+        return not (result and result[0])
 
     @measure_time("db_get_repetition_candidates")
     def get_repetition_candidates(self, user_id: str) -> list[QuestionCandidate]:
-        conn = self._get_connection()
         threshold = GameConfig.MASTERY_THRESHOLD
 
         query = """
@@ -46,24 +40,20 @@ class SQLiteQuizRepository(IQuizRepository):
                            AND up.timestamp < date ('now', '-3 days') \
                     ) \
                 """
-        cursor = conn.execute(query, (user_id, threshold, threshold))
-
-        candidates = []
-        for row in cursor.fetchall():
-            q_json, streak, seen = row
-            q = Question.model_validate_json(q_json)
-            candidates.append(
-                QuestionCandidate(question=q, streak=streak, is_seen=bool(seen))
+        with self.db_manager.acquire() as conn:
+            rows = conn.execute(query, (user_id, threshold, threshold)).fetchall()
+
+        return [
+            QuestionCandidate(
+                question=Question.model_validate_json(q_json),
+                streak=streak,
+                is_seen=bool(seen),
             )
-
-        if not self.db_manager._shared_connection:
-            conn.close()
-
-        return candidates
+            for q_json, streak, seen in rows
+        ]
 
     @measure_time("db_get_category_stats")
     def get_category_stats(self, user_id: str) -> list[dict[str, int | str]]:
-        conn = self._get_connection()
         threshold = GameConfig.MASTERY_THRESHOLD
 
         self.telemetry.log_info(
@@ -84,10 +74,10 @@ class SQLiteQuizRepository(IQuizRepository):
               GROUP BY q.category \
               """
 
-        cursor = conn.execute(sql, (threshold, user_id))
+        with self.db_manager.acquire() as conn:
+            raw_rows = conn.execute(sql, (threshold, user_id)).fetchall()
 
         stats = []
-        raw_rows = cursor.fetchall()
 
         for row in raw_rows:
             stats.append(
@@ -98,48 +88,39 @@ class SQLiteQuizRepository(IQuizRepository):
                 }
             )
 
-        if not self.db_manager._shared_connection:
-            conn.close()
         return stats
 
     def get_questions_by_ids(self, question_ids: list[str]) -> list[Question]:
         if not question_ids:
             return []
         placeholders = ",".join(["?"] * len(question_ids))
-        conn = self._get_connection()
         try:
-            cursor = conn.execute(
-                f"SELECT json_data FROM questions WHERE id IN ({placeholders})",
-                question_ids,
-            )
-            return [Question.model_validate_json(row[0]) for row in cursor.fetchall()]
+            with self.db_manager.acquire() as conn:
+                cursor = conn.execute(
+                    f"SELECT json_data FROM questions WHERE id IN ({placeholders})",
+                    question_ids,
+                )
+                rows = cursor.fetchall()
+            return [Question.model_validate_json(row[0]) for row in rows]
         except Exception as e:
             self.telemetry.log_error("get_questions_by_ids failed", e)
             return []
-        finally:
-            if not self.db_manager._shared_connection:
-                conn.close()
 
     def seed_questions(self, questions: list[Question]) -> None:
-        conn = self._get_connection()
         try:
-            cursor = conn.cursor()
-            for q in questions:
-                cursor.execute(
+            with self.db_manager.acquire() as conn:
+                # One prepared statement + one transaction for the whole batch
+                conn.executemany(
                     "INSERT OR REPLACE INTO questions (id, json_data, category) "
                     "VALUES (?, ?, ?)",
-                    (q.id, q.model_dump_json(), q.category),
+                    ((q.id, q.model_dump_json(), q.category) for q in questions),
                 )
-            conn.commit()
+                conn.commit()
         except sqlite3.Error as e:
             self.telemetry.log_error("seed_questions failed", e)
-        finally:
-            if not self.db_manager._shared_connection:
-                conn.close()
 
     def get_or_create_profile(self, user_id: str) -> UserProfile:
-        conn = self._get_connection()
-        try:
+        with self.db_manager.acquire() as conn:
             cursor = conn.execute(
                 "SELECT * FROM user_profiles WHERE user_id = ?", (user_id,)
             )
@@ -223,13 +204,9 @@ class SQLiteQuizRepository(IQuizRepository):
                 self.save_profile(profile)
 
             return profile
-        finally:
-            if not self.db_manager._shared_connection:
-                conn.close()
 
     def save_profile(self, profile: UserProfile) -> None:
-        conn = self._get_connection()
-        try:
+        with self.db_manager.acquire() as conn:
             conn.execute(
                 """
                 UPDATE user_profiles
@@ -256,13 +233,9 @@ class SQLiteQuizRepository(IQuizRepository):
                 ),
             )
             conn.commit()
-        finally:
-            if not self.db_manager._shared_connection:
-                conn.close()
 
     @measure_time("db_save_attempt")
     def save_attempt(self, user_id: str, question_id: str, is_correct: bool) -> None:
-        conn = self._get_connection()
         try:
             is_correct_int = 1 if is_correct else 0
             initial_streak = 1 if is_correct else 0
@@ -285,20 +258,19 @@ class SQLiteQuizRepository(IQuizRepository):
                   timestamp = CURRENT_TIMESTAMP
                   """
 
-            conn.execute(sql, (user_id, question_id, is_correct_int, initial_streak))
-            conn.commit()
+            with self.db_manager.acquire() as conn:
+                conn.execute(
+                    sql, (user_id, question_id, is_correct_int, initial_streak)
+                )
+                conn.commit()
         except Exception as e:
             self.telemetry.log_error(f"save_attempt failed for {user_id}", e)
             raise e
-        finally:
-            if not self.db_manager._shared_connection:
-                conn.close()
 
-    def get_questions_by_category(
-        self, category: str, user_id: str, limit: int = GameConfig.SPRINT_QUESTIONS
-    ) -> list[Question]:
-        conn = self._get_connection()
-        try:
+    def get_category_candidates(
+        self, category: str, user_id: str
+    ) -> list[tuple[Question, int]]:
+        with self.db_manager.acquire() as conn:
             query = """
                     SELECT q.json_data, COALESCE(up.consecutive_correct, 0) as streak
                     FROM questions q
@@ -306,26 +278,21 @@ class SQLiteQuizRepository(IQuizRepository):
                                        ON q.id = up.question_id AND up.user_id = ?
                     WHERE q.category = ? \
                     """
-
-            # Fetch all matching category questions first
             rows = conn.execute(query, (user_id, category)).fetchall()
 
-            # Convert to candidates
-            candidates = [
-                (Question.model_validate_json(row[0]), row[1]) for row in rows
-            ]
+        return [(Question.model_validate_json(row[0]), row[1]) for row in rows]
 
-            # Use Domain Logic to sort and limit
-            return CategorySelector.prioritize_weak_questions(candidates, limit)
-        finally:
-            if not self.db_manager._shared_connection:
-                conn.close()
+    def get_questions_by_category(
+        self, category: str, user_id: str, limit: int = GameConfig.SPRINT_QUESTIONS
+    ) -> list[Question]:
+        # Use Domain Logic to sort and limit
+        candidates = self.get_category_candidates(category, user_id)
+        return CategorySelector.prioritize_weak_questions(candidates, limit)
 
     @measure_time("db_get_mastery")
     def get_mastery_percentage(self, user_id: str, category: str) -> float:
-        conn = self._get_connection()
         threshold = GameConfig.MASTERY_THRESHOLD
-        try:
+        with self.db_manager.acquire() as conn:
             sql = """
                   SELECT COUNT(q.id) as total, \
                          SUM(CASE \
@@ -344,13 +311,9 @@ class SQLiteQuizRepository(IQuizRepository):
             if not row or row[0] == 0:
                 return 0.0
             return float(row[1]) / float(row[0])
-        finally:
-            if not self.db_manager._shared_connection:
-                conn.close()
 
     def debug_dump_user_progress(self, user_id: str) -> list[dict[str, Any]]:
-        conn = self._get_connection()
-        try:
+        with self.db_manager.acquire() as conn:
             cursor = conn.execute(
                 """
                 SELECT question_id, is_correct, consecutive_correct, timestamp
@@ -363,6 +326,3 @@ class SQLiteQuizRepository(IQuizRepository):
             )
             columns = [desc[0] for desc in cursor.description]
             return [dict(zip(columns, row, strict=False)) for row in cursor.fetchall()]
-        finally:
-            if not self.db_manager._shared_connection:
-                conn.close()
@@ -240,9 +240,9 @@ class SupabaseQuizRepository(IQuizRepository):
             self.telemetry.log_error("get_repetition_candidates failed", e)
             return []
 
-    def get_questions_by_category(
-        self, category: str, user_id: str, limit: int = GameConfig.SPRINT_QUESTIONS
-    ) -> list[Question]:
+    def get_category_candidates(
+        self, category: str, user_id: str
+    ) -> list[tuple[Question, int]]:
         response = (
             self.client.table("questions")
             .select("json_data, user_progress!left(consecutive_correct)")
@@ -266,6 +266,12 @@ class SupabaseQuizRepository(IQuizRepository):
 
             candidates.append((question, int(streak)))
 
+        return candidates
+
+    def get_questions_by_category(
+        self, category: str, user_id: str, limit: int = GameConfig.SPRINT_QUESTIONS
+    ) -> list[Question]:
+        candidates = self.get_category_candidates(category, user_id)
         return CategorySelector.prioritize_weak_questions(candidates, limit * 3)
 
     def get_category_stats(self, user_id: str) -> list[dict[str, int | str]]:
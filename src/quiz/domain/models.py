@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
 from typing import Any
@@ -93,6 +93,20 @@ class QuestionCandidate:
     is_seen: bool
 
 
+@dataclass(slots=True)
+class QuizSession:
+    """Progress of the running quiz, kept under a single session_state key."""
+
+    questions: tuple[Question, ...] = ()  # fixed for the quiz's lifetime
+    title: str = ""
+    current_index: int = 0
+    score: int = 0
+    answers_history: list[bool] = field(default_factory=list)
+    feedback_mode: bool = False
+    last_feedback: dict[str, Any] | None = None
+    errors: list[str] = field(default_factory=list)  # IDs of failed questions
+
+
 class UserProfile(BaseModel):
     user_id: str
     streak_days: int = 0
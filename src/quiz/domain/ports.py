@@ -35,6 +35,15 @@ class IQuizRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_category_candidates(
+        self, category: str, user_id: str
+    ) -> list[tuple[Question, int]]:
+        """
+        Fetches raw (question, streak) rows for Category Mode, unsorted.
+        """
+        pass
+
     @abstractmethod
     def get_questions_by_category(
         self, category: str, user_id: str, limit: int
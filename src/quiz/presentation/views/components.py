@@ -2,41 +2,50 @@
 
 import streamlit as st
 
+from src.components.mobile.shared import minify_css
+
+# Global page CSS, defined once at import and shared by every session.
+# It is deliberately re-emitted each rerun: Streamlit removes any element
+# a rerun does not write again, so a "first paint only" guard would drop it.
+# Minified once here, since it is sent on every rerun.
+GLOBAL_CSS = minify_css(
+    """
+<style>
+    /* 1. HIDE STREAMLIT HEADER/TOOLBAR */
+    header[data-testid="stHeader"] {
+        visibility: hidden;
+        height: 0px;
+    }
+
+    /* 2. HIDE THE COLORED DECORATION BAR AT TOP */
+    div[data-testid="stDecoration"] {
+        visibility: hidden;
+        height: 0px;
+    }
+
+    /* 3. ADJUST TOP PADDING TO RECLAIM SPACE */
+    /* The block-container is the main wrapper. We pull it up. */
+    .block-container {
+        padding-top: 0rem !important; /* Was 1rem or 6rem */
+        padding-bottom: 1rem !important;
+    }
+
+    /* 4. HIDE FOOTER (Optional, "Made with Streamlit") */
+    footer {
+        visibility: hidden;
+        height: 0px;
+    }
+
+    /* ... (Keep your existing button styles below) ... */
+    div[data-testid="stButton"] > button {
+        /* ... your existing button CSS ... */
+    }
+</style>
+"""
+)
+
 
 def apply_styles() -> None:
-    st.markdown(
-        """
-        <style>
-            /* 1. HIDE STREAMLIT HEADER/TOOLBAR */
-            header[data-testid="stHeader"] {
-                visibility: hidden;
-                height: 0px;
-            }
-
-            /* 2. HIDE THE COLORED DECORATION BAR AT TOP */
-            div[data-testid="stDecoration"] {
-                visibility: hidden;
-                height: 0px;
-            }
-
-            /* 3. ADJUST TOP PADDING TO RECLAIM SPACE */
-            /* The block-container is the main wrapper. We pull it up. */
-            .block-container {
-                padding-top: 0rem !important; /* Was 1rem or 6rem */
-                padding-bottom: 1rem !important;
-            }
-
-            /* 4. HIDE FOOTER (Optional, "Made with Streamlit") */
-            footer {
-                visibility: hidden;
-                height: 0px;
-            }
-
-            /* ... (Keep your existing button styles below) ... */
-            div[data-testid="stButton"] > button {
-                /* ... your existing button CSS ... */
-            }
-        </style>
-    """,
-        unsafe_allow_html=True,
-    )
+    # Style-only st.html goes to the event container: no markdown parsing
+    # and no empty block taking up layout space at the top of the page.
+    st.html(GLOBAL_CSS)
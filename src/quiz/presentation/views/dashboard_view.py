@@ -5,14 +5,20 @@ import streamlit as st
 from src.components.mobile import mobile_dashboard, mobile_hero
 
 
+@st.fragment
 def render_dashboard_screen(
     service: Any, user_id: str, demo_slug: str | None = None
 ) -> None:
+    """
+    Runs as a fragment: a tap on the dashboard is handled by rerunning only
+    this function. Actions that switch screens then request a full app rerun
+    themselves (via GameService).
+    """
     # 1. Get Data from Service
     data = service.get_dashboard_stats(user_id, demo_slug)
 
     # NEW: Check bonus mode
-    profile = service.repo.get_or_create_profile(user_id)
+    profile = service.profile_manager.get()
     if profile.is_bonus_mode():
         st.success(
             f"🎉 Bonus Mode! Goal reached: {profile.daily_progress}/{profile.daily_goal}"
@@ -45,5 +51,5 @@ def render_dashboard_screen(
         elif action["type"] == "CATEGORY":
             service.start_category_mode(user_id, action["payload"])
         elif action["type"] == "LANGUAGE":
+            # Service reruns only when the language actually changed
             service.update_language(user_id, action["payload"])
-            st.rerun()
@@ -1,49 +1,104 @@
 import os
+from functools import lru_cache
 from typing import Any
 
 import streamlit as st
-
-from src.components.mobile import mobile_header, mobile_option, mobile_result_row
-from src.quiz.domain.models import Language, Question
+from streamlit.errors import StreamlitAPIException
+
+from src.components.mobile import (
+    mobile_header,
+    mobile_option_group,
+    mobile_result_group,
+)
+from src.game import query_cache
+from src.quiz.domain.models import Language, OptionKey, Question, QuizSession
+
+# Question text block; built once at import, only id/text vary per rerun
+QUESTION_HTML = """
+<div style="
+    font-size: 16px;  /* Increased from 1rem (16px) */
+    font-weight: 600; /* Medium weight for emphasis */
+    color: #111827;
+    margin-top: 10px;
+    margin-bottom: 20px; /* More breathing room */
+    line-height: 1.6;    /* Improved readability */
+    letter-spacing: -0.011em;">
+    {id}: {text}
+</div>
+"""
+
+
+@lru_cache(maxsize=4096)
+def _image_exists(path: str) -> bool:
+    """Question image paths are static, so stat() each one only once."""
+    return os.path.exists(path)
+
+
+# Bounded: the cache is process-wide and holds raw image bytes
+@st.cache_data(max_entries=512, show_spinner=False)
+def _load_image_bytes(path: str) -> bytes:
+    """Reads a question image once; later reruns are served from memory."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _rerun_quiz() -> None:
+    """
+    Reruns only the quiz fragment (answer -> feedback -> next question).
+    Falls back to a full rerun when the click was handled in a full-app run,
+    where Streamlit rejects fragment-scoped reruns.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
 
 
+@st.fragment
 def render_quiz_screen(service: Any, user_id: str) -> None:
     """
     Main entry point for the Quiz Screen.
     Orchestrates rendering based on session state (Active vs Feedback).
+    Runs as a fragment: intra-quiz clicks rerun only this function, not the
+    whole app script. Leaving the quiz (home, summary) still reruns the app.
     """
     # 1. Get State from Session
-    if "quiz_questions" not in st.session_state or not st.session_state.quiz_questions:
+    quiz: QuizSession | None = st.session_state.get("quiz")
+    if quiz is None or not quiz.questions:
         st.error("Brak pytań w sesji. Powrót do menu.")
         st.session_state.screen = "dashboard"
         st.rerun()
 
-    idx = st.session_state.current_index
-    questions = st.session_state.quiz_questions
+    idx = quiz.current_index
+    questions = quiz.questions
     question: Question = questions[idx]
 
-    # Cache profile in session state
-    if "cached_profile" not in st.session_state:
-        st.session_state.cached_profile = service.profile_manager.get()
-
-    profile = st.session_state.cached_profile
+    # Profile is session-cached by ProfileManager (no DB hit per rerun)
+    profile = service.profile_manager.get()
     user_lang = profile.preferred_language
 
     # 3. Calculate Progress for Header
     total = len(questions)
-    # Calculate mastery for the current category on the fly
-    # (Optional optimization: cache this in session state if it's too slow)
-    category_mastery = service.repo.get_mastery_percentage(user_id, question.category)
+    # Mastery for the current category, cached until the user's next answer
+    category_mastery = query_cache.get_mastery_percentage(
+        service.repo, user_id, question.category
+    )
 
     # 4. Render Header
     _render_compact_header(idx + 1, total, question.category, category_mastery)
 
     # 5. Render Content (Active Question or Feedback)
-    if st.session_state.get("feedback_mode", False):
-        _render_feedback(service, question, user_lang)
+    if quiz.feedback_mode and quiz.last_feedback is not None:
+        _render_feedback(service, question, quiz.last_feedback, user_lang)
     else:
         _render_active(service, user_id, question, user_lang)
 
+    # 6. Warm the image cache for the next question
+    if idx + 1 < total:
+        next_image = questions[idx + 1].image_path
+        if next_image and _image_exists(next_image):
+            _load_image_bytes(next_image)
+
 
 def _render_compact_header(
     current_idx: int, total: int, category: str, mastery: float
@@ -64,33 +119,23 @@ def _render_active(
 ) -> None:
     # 1. Question Text (ALWAYS POLISH - Source of Truth)
     st.markdown(
-        f"""
-        <div style="
-            font-size: 16px;  /* Increased from 1rem (16px) */
-            font-weight: 600; /* Medium weight for emphasis */
-            color: #111827;
-            margin-top: 10px;
-            margin-bottom: 20px; /* More breathing room */
-            line-height: 1.6;    /* Improved readability */
-            letter-spacing: -0.011em;">
-            {q.id}: {q.text}
-        </div>
-        """,
+        QUESTION_HTML.format(id=q.id, text=q.text),
         unsafe_allow_html=True,
     )
 
-    if q.image_path and os.path.exists(q.image_path):
-        st.image(q.image_path, use_container_width=True)
+    if q.image_path and _image_exists(q.image_path):
+        st.image(_load_image_bytes(q.image_path), use_container_width=True)
 
     # 2. Options (ALWAYS POLISH - Source of Truth)
-    for key, text in q.options.items():
-        # mobile_option returns the key (e.g., "A") if clicked
-        clicked_key = mobile_option(key.value, text, key=f"opt_{q.id}_{key}")
+    # One component for all options: returns the key (e.g., "A") if clicked
+    clicked_key = mobile_option_group(
+        [(key.value, text) for key, text in q.options.items()], key=f"opts_{q.id}"
+    )
 
-        if clicked_key:
-            # --- DIRECT SERVICE CALL ---
-            service.submit_answer(user_id, q, key)
-            st.rerun()
+    if clicked_key:
+        # --- DIRECT SERVICE CALL ---
+        service.submit_answer(user_id, q, OptionKey(clicked_key))
+        _rerun_quiz()
 
     # 3. Hint (Persisted Language Selection)
     if q.hint:
@@ -137,9 +182,8 @@ def _render_active(
                 # Linear Check: If value changed, trigger action immediately.
                 if selected_lang is not None and selected_lang != user_lang:
                     # --- DIRECT SERVICE CALL ---
+                    # Service reruns the app; no second rerun needed here
                     service.update_language(user_id, selected_lang.value)
-                    # Service handles rerun, but we can do it here to be explicit
-                    st.rerun()
 
                 # Handle None case (if user deselects) -> fallback to default
                 display_lang = selected_lang if selected_lang else default_selection
@@ -150,28 +194,28 @@ def _render_active(
                 st.info(q.hint)
 
 
-def _render_feedback(service: Any, q: Question, user_lang: Language) -> None:
+def _render_feedback(
+    service: Any, q: Question, fb: dict[str, Any], user_lang: Language
+) -> None:
     """
     Renders the feedback screen using the new Gentle Result Rows.
     """
-    # Retrieve feedback data from session state
-    fb = st.session_state.last_feedback
-
     # Question Text (Polish)
     st.markdown(f"{q.id}: {q.text}")
 
-    if q.image_path and os.path.exists(q.image_path):
-        st.image(q.image_path, use_container_width=True)
+    if q.image_path and _image_exists(q.image_path):
+        st.image(_load_image_bytes(q.image_path), use_container_width=True)
 
-    # Result Rows (Polish)
-    for key, text in q.options.items():
-        state = "neutral"
-        if key == fb["correct_option"]:
-            state = "correct" if key == fb["selected"] else "missed"
-        elif key == fb["selected"] and not fb["is_correct"]:
-            state = "wrong"
+    # Result Rows (Polish) - one component for all rows.
+    # At most two options are highlighted; every other key stays neutral.
+    states = {fb["correct_option"]: "correct" if fb["is_correct"] else "missed"}
+    if not fb["is_correct"]:
+        states[fb["selected"]] = "wrong"
 
-        mobile_result_row(key.value, text, state=state, key=f"res_{q.id}_{key}")
+    rows = [
+        (key.value, text, states.get(key, "neutral")) for key, text in q.options.items()
+    ]
+    mobile_result_group(rows, key=f"res_{q.id}")
 
     # Hint (collapsed) - Show what was available
     if q.hint:
@@ -191,6 +235,10 @@ def _render_feedback(service: Any, q: Question, user_lang: Language) -> None:
                 with st.expander("🇵🇱 Pokaż wyjaśnienie po polsku"):
                     st.write(q.explanation)
 
-    if st.button("Dalej ➡️", type="primary", use_container_width=True):
+    if st.button(
+        "Dalej ➡️", type="primary", use_container_width=True, key="btn_next_question"
+    ):
         service.next_question()
-        st.rerun()
+        if st.session_state.screen == "summary":
+            st.rerun()
+        _rerun_quiz()
@@ -3,6 +3,7 @@ from typing import Any
 import streamlit as st
 
 from src.config import GameConfig
+from src.quiz.domain.models import QuizSession
 
 
 def render_summary_screen(service: Any, user_id: str) -> None:
@@ -10,9 +11,10 @@ def render_summary_screen(service: Any, user_id: str) -> None:
     service.profile_manager.flush_on_exit()
 
     # 1. Get State
-    score = st.session_state.get("score", 0)
-    total = len(st.session_state.get("quiz_questions", []))
-    errors = st.session_state.get("quiz_errors", [])
+    quiz: QuizSession = st.session_state.get("quiz") or QuizSession()
+    score = quiz.score
+    total = len(quiz.questions)
+    errors = quiz.errors
 
     is_passed = score >= GameConfig.PASSING_SCORE
 
@@ -41,14 +43,24 @@ def render_summary_screen(service: Any, user_id: str) -> None:
 
     # 3. Actions
     with col_a:
-        if st.button("🔄 Menu Główne", type="secondary", use_container_width=True):
+        if st.button(
+            "🔄 Menu Główne",
+            type="secondary",
+            use_container_width=True,
+            key="btn_summary_menu",
+        ):
             st.session_state.screen = "dashboard"
             st.rerun()
 
     with col_b:
         # Only show Review button if there were errors
         if errors:
-            if st.button("🛠️ Popraw Błędy", type="primary", use_container_width=True):
+            if st.button(
+                "🛠️ Popraw Błędy",
+                type="primary",
+                use_container_width=True,
+                key="btn_summary_review_errors",
+            ):
                 # Logic to restart quiz with errors
                 questions = service.repo.get_questions_by_ids(errors)
                 service._reset_quiz_state(questions, "🛠️ Poprawa Błędów")
@@ -1,14 +1,16 @@
 import logging
+import os
 import sys
+import threading
 import time
 import uuid
 from collections.abc import Callable
 from contextvars import ContextVar
 from functools import wraps
-from typing import Any, ParamSpec, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast
 
-# --- Prometheus Imports ---
-from prometheus_client import REGISTRY, Histogram
+if TYPE_CHECKING:
+    from prometheus_client import Histogram
 
 # --- Context for Correlation IDs ---
 correlation_id_ctx: ContextVar[str] = ContextVar("correlation_id", default="system")
@@ -16,18 +18,63 @@ correlation_id_ctx: ContextVar[str] = ContextVar("correlation_id", default="syst
 # --- Prometheus Metric Definition ---
 METRIC_NAME = "app_method_duration_seconds"
 
-# Explicitly declare the type for module-level usage
-METHOD_DURATION: Histogram
+# Metrics are only recorded when there is somewhere to scrape them from.
+# Leaving PROMETHEUS_PORT unset keeps prometheus_client out of the import path.
+METRICS_PORT_ENV = "PROMETHEUS_PORT"
+
+_method_duration: "Histogram | None" = None
+_metrics_configured = False
+# Streamlit serves each session on its own thread; the first timed calls race
+_metrics_lock = threading.Lock()
+
+
+def get_method_duration() -> "Histogram | None":
+    """
+    Lazily creates the duration histogram on first use.
+    Returns None when metrics export is not configured.
+    """
+    global _method_duration, _metrics_configured
+    if _metrics_configured:
+        return _method_duration
+
+    with _metrics_lock:
+        if not _metrics_configured:
+            if os.getenv(METRICS_PORT_ENV):
+                from prometheus_client import REGISTRY, Histogram
+
+                try:
+                    _method_duration = Histogram(
+                        METRIC_NAME, "Time spent in method", ["component", "method"]
+                    )
+                except ValueError:
+                    # If it already exists, we get it from the registry.
+                    # We cast it to Histogram to satisfy Mypy.
+                    _collector = REGISTRY._names_to_collectors[METRIC_NAME]
+                    _method_duration = cast(Histogram, _collector)
+            # Only flagged once the histogram (if any) is assigned
+            _metrics_configured = True
+
+    return _method_duration
+
+
+def start_metrics_server() -> bool:
+    """
+    Starts the Prometheus /metrics endpoint on PROMETHEUS_PORT.
+    Bootstrap code calls this once per process; returns whether it is serving.
+    """
+    port = os.getenv(METRICS_PORT_ENV)
+    if not port:
+        return False
+
+    from prometheus_client import start_http_server
+
+    try:
+        start_http_server(int(port))
+    except (OSError, ValueError) as e:
+        Telemetry("Telemetry").log_error("Metrics server failed to start", e, port=port)
+        return False
+    return True
 
-try:
-    METHOD_DURATION = Histogram(
-        METRIC_NAME, "Time spent in method", ["component", "method"]
-    )
-except ValueError:
-    # If it already exists, we get it from the registry.
-    # We cast it to Histogram to satisfy Mypy.
-    _collector = REGISTRY._names_to_collectors[METRIC_NAME]
-    METHOD_DURATION = cast(Histogram, _collector)
 
 # --- Type Definitions for Decorator ---
 P = ParamSpec("P")
@@ -58,9 +105,11 @@ def measure_time(metric_name: str) -> Callable[[Callable[P, R]], Callable[P, R]]
                 duration = time.perf_counter() - start
 
                 # Prometheus
-                METHOD_DURATION.labels(component=component, method=method).observe(
-                    duration
-                )
+                histogram = get_method_duration()
+                if histogram is not None:
+                    histogram.labels(component=component, method=method).observe(
+                        duration
+                    )
 
                 # Console Log
                 telemetry = getattr(self_obj, "telemetry", None)
@@ -72,9 +121,11 @@ def measure_time(metric_name: str) -> Callable[[Callable[P, R]], Callable[P, R]]
                 return result
             except Exception as e:
                 duration = time.perf_counter() - start
-                METHOD_DURATION.labels(component=component, method=method).observe(
-                    duration
-                )
+                histogram = get_method_duration()
+                if histogram is not None:
+                    histogram.labels(component=component, method=method).observe(
+                        duration
+                    )
 
                 telemetry = getattr(self_obj, "telemetry", None)
                 if telemetry:
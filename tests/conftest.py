@@ -53,6 +53,19 @@ def mock_streamlit_session():
         st.session_state = original_session_state
 
 
+@pytest.fixture(autouse=True)
+def clear_streamlit_caches():
+    """
+    st.cache_data / st.cache_resource are process-global, so cached reads
+    (see src/game/query_cache.py) must not leak between tests.
+    """
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    yield
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
 @pytest.fixture
 def sample_question():
     return Question(
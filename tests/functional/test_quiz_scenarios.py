@@ -87,40 +87,40 @@ def test_daily_sprint_perfect_run():
 
         # Verify session state initialized
         assert st.session_state.screen == "quiz"
-        assert st.session_state.quiz_title == "🚀 Codzienny Sprint"
-        assert len(st.session_state.quiz_questions) == 3
-        assert st.session_state.current_index == 0
-        assert st.session_state.score == 0
+        assert st.session_state.quiz.title == "🚀 Codzienny Sprint"
+        assert len(st.session_state.quiz.questions) == 3
+        assert st.session_state.quiz.current_index == 0
+        assert st.session_state.quiz.score == 0
 
         # Answer Q1 correctly
-        q1 = st.session_state.quiz_questions[0]
+        q1 = st.session_state.quiz.questions[0]
         service.submit_answer("test_user", q1, OptionKey.A)
-        assert st.session_state.score == 1
-        assert st.session_state.feedback_mode is True
+        assert st.session_state.quiz.score == 1
+        assert st.session_state.quiz.feedback_mode is True
 
         service.next_question()
-        assert st.session_state.current_index == 1
-        assert st.session_state.feedback_mode is False
+        assert st.session_state.quiz.current_index == 1
+        assert st.session_state.quiz.feedback_mode is False
 
         # Answer Q2 correctly
-        q2 = st.session_state.quiz_questions[1]
+        q2 = st.session_state.quiz.questions[1]
         service.submit_answer("test_user", q2, OptionKey.B)
-        assert st.session_state.score == 2
+        assert st.session_state.quiz.score == 2
 
         service.next_question()
-        assert st.session_state.current_index == 2
+        assert st.session_state.quiz.current_index == 2
 
         # Answer Q3 correctly
-        q3 = st.session_state.quiz_questions[2]
+        q3 = st.session_state.quiz.questions[2]
         service.submit_answer("test_user", q3, OptionKey.A)
-        assert st.session_state.score == 3
+        assert st.session_state.quiz.score == 3
 
         service.next_question()
 
         # Verify summary screen
         assert st.session_state.screen == "summary"
-        assert st.session_state.score == 3
-        assert len(st.session_state.quiz_errors) == 0
+        assert st.session_state.quiz.score == 3
+        assert len(st.session_state.quiz.errors) == 0
 
 
 def test_daily_sprint_with_mistakes():
@@ -141,33 +141,33 @@ def test_daily_sprint_with_mistakes():
         service.start_daily_sprint("test_user")
 
         # Answer Q1 WRONG
-        q1 = st.session_state.quiz_questions[0]
+        q1 = st.session_state.quiz.questions[0]
         service.submit_answer("test_user", q1, OptionKey.B)  # Wrong!
 
-        assert st.session_state.score == 0
-        assert "Q1" in st.session_state.quiz_errors
-        assert st.session_state.last_feedback["is_correct"] is False
+        assert st.session_state.quiz.score == 0
+        assert "Q1" in st.session_state.quiz.errors
+        assert st.session_state.quiz.last_feedback["is_correct"] is False
 
         service.next_question()
 
         # Answer Q2 correctly
-        q2 = st.session_state.quiz_questions[1]
+        q2 = st.session_state.quiz.questions[1]
         service.submit_answer("test_user", q2, OptionKey.B)
-        assert st.session_state.score == 1
+        assert st.session_state.quiz.score == 1
 
         service.next_question()
 
         # Answer Q3 correctly
-        q3 = st.session_state.quiz_questions[2]
+        q3 = st.session_state.quiz.questions[2]
         service.submit_answer("test_user", q3, OptionKey.A)
-        assert st.session_state.score == 2
+        assert st.session_state.quiz.score == 2
 
         service.next_question()
 
         # Verify summary
         assert st.session_state.screen == "summary"
-        assert st.session_state.score == 2
-        assert len(st.session_state.quiz_errors) == 1
+        assert st.session_state.quiz.score == 2
+        assert len(st.session_state.quiz.errors) == 1
 
 
 def test_category_mode_selection():
@@ -177,7 +177,7 @@ def test_category_mode_selection():
     # Create actual Question objects (not candidates)
     questions = [create_question(f"Q{i}", OptionKey.A) for i in range(5)]
 
-    mock_repo.get_questions_by_category.return_value = questions
+    mock_repo.get_category_candidates.return_value = [(q, 0) for q in questions]
     mock_repo.get_or_create_profile.return_value = UserProfile(
         user_id="test_user",
         has_completed_onboarding=True,
@@ -193,10 +193,10 @@ def test_category_mode_selection():
 
     # Verify
     assert st.session_state.screen == "quiz"
-    assert st.session_state.quiz_title == "📚 BHP"
-    assert len(st.session_state.quiz_questions) == 5
+    assert st.session_state.quiz.title == "📚 BHP"
+    assert len(st.session_state.quiz.questions) == 5
 
-    mock_repo.get_questions_by_category.assert_called_once()
+    mock_repo.get_category_candidates.assert_called_once()
 
 
 def test_onboarding_flow():
@@ -218,9 +218,9 @@ def test_onboarding_flow():
 
     # Verify
     assert st.session_state.screen == "quiz"
-    assert st.session_state.quiz_title == "🎓 Szkolenie Wstępne"
-    assert len(st.session_state.quiz_questions) == 1
-    assert st.session_state.quiz_questions[0].id == "TUT-01"
+    assert st.session_state.quiz.title == "🎓 Szkolenie Wstępne"
+    assert len(st.session_state.quiz.questions) == 1
+    assert st.session_state.quiz.questions[0].id == "TUT-01"
 
     # Profile should be marked as onboarded
     mock_repo.save_profile.assert_called_once()
@@ -48,6 +48,19 @@ class TestDatabaseManagerInit:
 
         db.close()
 
+    def test_init_creates_category_index(self, tmp_path):
+        db = DatabaseManager(str(tmp_path / "test.db"))
+        conn = db.get_connection()
+
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM questions WHERE category = ?",
+            ("BHP",),
+        ).fetchall()
+
+        assert any("idx_questions_category" in row[-1] for row in plan)
+
+        db.close()
+
 
 class TestConnectionManagement:
     def test_get_connection_returns_working_connection(self, tmp_path):
@@ -143,6 +156,89 @@ class TestConnectionManagement:
         db.close()  # Double close
 
 
+class TestConnectionPool:
+    def test_acquire_returns_working_connection(self, tmp_path):
+        """Test acquire() yields a usable pooled connection."""
+        db = DatabaseManager(str(tmp_path / "test.db"))
+
+        with db.acquire() as conn:
+            assert conn.execute("SELECT 1").fetchone() == (1,)
+
+        db.close()
+
+    def test_acquire_is_reentrant_on_same_thread(self, tmp_path):
+        """Test nested acquire() reuses the connection already held."""
+        db = DatabaseManager(str(tmp_path / "test.db"), pool_size=1)
+
+        with db.acquire() as outer:
+            with db.acquire() as inner:
+                assert inner is outer
+
+        db.close()
+
+    def test_acquire_returns_connection_to_pool(self, tmp_path):
+        """Test connections are reused instead of reopened per call."""
+        db = DatabaseManager(str(tmp_path / "test.db"), pool_size=2)
+
+        with db.acquire() as conn1:
+            pass
+        with db.acquire() as conn2:
+            pass
+
+        assert conn1 is conn2
+        db.close()
+
+    def test_memory_db_pool_uses_shared_connection(self):
+        """Test in-memory DBs pool only the connection holding the data."""
+        db = DatabaseManager(":memory:", pool_size=4)
+
+        with db.acquire() as conn:
+            assert conn is db.get_connection()
+        assert db.pool_size == 1
+        db.close()
+
+    def test_acquire_rolls_back_on_error(self, tmp_path):
+        """Test a failing block does not leave an open transaction behind."""
+        db = DatabaseManager(str(tmp_path / "test.db"))
+
+        with pytest.raises(RuntimeError):
+            with db.acquire() as conn:
+                conn.execute(
+                    "INSERT INTO questions (id, category, json_data) "
+                    "VALUES ('Q1', 'Cat', '{}')"
+                )
+                raise RuntimeError("boom")
+
+        with db.acquire() as conn:
+            assert not conn.in_transaction
+            count = conn.execute("SELECT count(*) FROM questions").fetchone()[0]
+        assert count == 0
+        db.close()
+
+    def test_pooled_connections_apply_pragmas(self, tmp_path):
+        """Test file connections are tuned when opened."""
+        db = DatabaseManager(str(tmp_path / "test.db"))
+
+        with db.acquire() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+        db.close()
+
+    def test_close_drains_pool(self, tmp_path):
+        """Test close() closes pooled connections and allows reopening."""
+        db = DatabaseManager(str(tmp_path / "test.db"), pool_size=2)
+        with db.acquire():
+            pass
+
+        db.close()
+
+        assert db._pool is None
+        with db.acquire() as conn:
+            assert conn.execute("SELECT 1").fetchone() == (1,)
+        db.close()
+
+
 class TestPickleSafety:
     def test_getstate_removes_connection(self, tmp_path):
         """Test __getstate__ removes unpickleable connection."""
@@ -150,9 +246,13 @@ class TestPickleSafety:
         db = DatabaseManager(db_path)
         db.get_connection()  # Create connection
 
+        with db.acquire():
+            pass  # Open the pool
+
         state = db.__getstate__()
 
         assert "_shared_connection" not in state
+        assert "_pool" not in state
         assert "db_path" in state
         assert "telemetry" in state
         db.close()
@@ -58,7 +58,7 @@ def test_get_repetition_candidates_logic(repo):
     repo.seed_questions(qs)
 
     # 2. Setup Progress
-    conn = repo._get_connection()
+    conn = repo.db_manager.get_connection()
 
     # Q_Learning: Streak 1 (Should show)
     # We insert it as 'yesterday' so it's not hidden by the "attempted today" filter
@@ -28,7 +28,7 @@ class TestSQLiteRepository:
         user_id = "new_user"
 
         # 1. Check DB before
-        conn = in_memory_repo._get_connection()
+        conn = in_memory_repo.db_manager.get_connection()
         cursor = conn.execute(
             "SELECT count(*) FROM user_profiles WHERE user_id=?", (user_id,)
         )
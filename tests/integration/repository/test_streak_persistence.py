@@ -51,7 +51,7 @@ def test_consecutive_login_increments_streak(repo, user_id):
 
     # Manually insert a profile representing "Yesterday"
     # We bypass the public API to set up the exact state we want (White Box Testing)
-    conn = repo._get_connection()
+    conn = repo.db_manager.get_connection()
     conn.execute(
         """
         INSERT INTO user_profiles (user_id, streak_days, last_login)
@@ -80,7 +80,7 @@ def test_missed_day_resets_streak(repo, user_id):
     two_days_ago = today - timedelta(days=2)
 
     # Setup: User had a massive streak of 100, but missed a day
-    conn = repo._get_connection()
+    conn = repo.db_manager.get_connection()
     conn.execute(
         """
         INSERT INTO user_profiles (user_id, streak_days, last_login)
@@ -127,7 +127,7 @@ def test_future_date_correction(repo, user_id):
     today = date.today()
     tomorrow = today + timedelta(days=1)
 
-    conn = repo._get_connection()
+    conn = repo.db_manager.get_connection()
     conn.execute(
         """
         INSERT INTO user_profiles (user_id, streak_days, last_login)
@@ -2,7 +2,11 @@
 
 from unittest.mock import MagicMock, patch
 
-from src.components.mobile.dashboard import mobile_dashboard
+from src.components.mobile.dashboard import (
+    _grid_html,
+    _render_items_html,
+    mobile_dashboard,
+)
 
 
 def test_mobile_dashboard_renders_all_categories():
@@ -29,9 +33,11 @@ def test_mobile_dashboard_renders_all_categories():
 
         # Assert
         mock_comp.assert_called_once()
-        # Check that data passed to component matches input
+        # Check that every category is rendered with its click payload
         call_kwargs = mock_comp.call_args.kwargs
-        assert call_kwargs["data"]["categories"] == categories
+        grid_html = call_kwargs["data"]["gridHtml"]
+        assert grid_html.count('class="cat-item card"') == len(categories)
+        assert 'data-cat-id="A"' in grid_html
 
 
 def test_mobile_dashboard_handles_click_event():
@@ -56,3 +62,45 @@ def test_mobile_dashboard_handles_click_event():
 
         # Assert
         assert result == {"type": "SPRINT", "payload": None}
+
+
+def test_mobile_dashboard_prebuilds_escaped_grid_html():
+    """
+    GIVEN categories with markup-like names and mixed progress
+    WHEN mobile_dashboard is called
+    THEN the grid HTML is built once in Python, escaped, with the right badges.
+    """
+    categories = [
+        {"id": "A", "name": "<b>Cat A</b>", "icon": "🦺", "progress": 0.125},
+        {"id": "B", "name": "Cat B", "icon": "📦", "progress": 1.0},
+    ]
+
+    with patch(
+        "src.components.mobile.dashboard._mobile_dashboard_component"
+    ) as mock_comp:
+        mock_comp.return_value = MagicMock(action=None)
+
+        mobile_dashboard(categories)
+
+        grid_html = mock_comp.call_args.kwargs["data"]["gridHtml"]
+        assert "&lt;b&gt;Cat A&lt;/b&gt;" in grid_html
+        assert '<div class="badge badge-green-light">13%</div>' in grid_html
+        assert '<div class="badge badge-green-solid">100%</div>' in grid_html
+        assert grid_html.count('class="cat-item card"') == 2
+        assert 'data-cat-id="B"' in grid_html
+
+
+def test_grid_html_reuses_markup_for_unchanged_categories():
+    """
+    GIVEN the same categories on two reruns
+    WHEN the grid HTML is built
+    THEN the second build is served from the item cache.
+    """
+    _render_items_html.cache_clear()
+    categories = [{"id": "A", "name": "Cat A", "icon": "🦺", "progress": 0.5}]
+
+    first = _grid_html(categories)
+    second = _grid_html([dict(c) for c in categories])
+
+    assert first == second
+    assert _render_items_html.cache_info().hits == 1
@@ -0,0 +1,46 @@
+# tests/unit/components/test_shared.py
+
+from src.components.mobile.shared import minify_css, minify_js
+
+
+def test_minify_css_strips_comments_and_whitespace():
+    css = """
+    /* comment */
+    .card:active {
+        color: #111827; /* inline */
+        font-family: "Inter", sans-serif;
+    }
+    div > button { }
+    """
+
+    assert minify_css(css) == (
+        '.card:active{color:#111827;font-family:"Inter",sans-serif;}\ndiv>button{}'
+    )
+
+
+def test_minify_css_keeps_descendant_pseudo_selector():
+    """'a :hover' and 'a:hover' are different selectors."""
+    assert minify_css("a :hover { color: red; }") == "a :hover{color:red;}"
+
+
+def test_minify_css_output_stays_multiline():
+    """Single-line strings are treated by Streamlit as asset file paths."""
+    assert "\n" in minify_css(".a { x: 1; } .b { y: 2; }")
+
+
+def test_minify_js_drops_comment_lines_and_indentation():
+    js = """
+    export default function(component) {
+        // Populate
+        const url = 'https://example.com';
+
+        return url;
+    }
+    """
+
+    assert minify_js(js) == (
+        "export default function(component) {\n"
+        "const url = 'https://example.com';\n"
+        "return url;\n"
+        "}"
+    )
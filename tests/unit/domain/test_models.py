@@ -7,7 +7,7 @@
 #   2. I/O: FORBIDDEN. No Database, No Network, No File System.
 #   3. MOCKS: Mandatory for Repositories and External Services.
 # ==============================================================================
-from src.quiz.domain.models import UserProfile
+from src.quiz.domain.models import QuizSession, UserProfile
 
 
 def test_user_profile_bonus_mode_logic():
@@ -24,3 +24,16 @@ def test_user_profile_not_in_bonus_mode():
 
     # Act & Assert
     assert profile.is_bonus_mode() is False
+
+
+def test_quiz_session_defaults_are_not_shared():
+    # Arrange
+    first = QuizSession()
+    second = QuizSession()
+
+    # Act
+    first.errors.append("Q1")
+
+    # Assert
+    assert second.errors == []
+    assert not hasattr(first, "__dict__")
@@ -0,0 +1,84 @@
+from unittest.mock import Mock
+
+from src.game import query_cache
+from src.quiz.domain.models import QuestionCandidate
+
+
+def make_repo(sample_question):
+    repo = Mock()
+    repo.get_repetition_candidates.return_value = [
+        QuestionCandidate(question=sample_question, streak=0, is_seen=False)
+    ]
+    return repo
+
+
+def test_repetition_candidates_cached_between_calls(sample_question):
+    """Repeated reads with no writes in between should hit the DB once."""
+    repo = make_repo(sample_question)
+
+    first = query_cache.get_repetition_candidates(repo, "test_user")
+    second = query_cache.get_repetition_candidates(repo, "test_user")
+
+    assert repo.get_repetition_candidates.call_count == 1
+    assert first == second
+
+
+def test_bump_revision_invalidates_cached_reads(sample_question):
+    """A write for the user must force the next read back to the DB."""
+    repo = make_repo(sample_question)
+
+    query_cache.get_repetition_candidates(repo, "test_user")
+    query_cache.bump_revision("test_user")
+    query_cache.get_repetition_candidates(repo, "test_user")
+
+    assert repo.get_repetition_candidates.call_count == 2
+
+
+def test_revision_is_per_user():
+    """Bumping one user's revision leaves others untouched."""
+    query_cache.bump_revision("user_a")
+
+    assert query_cache.get_revision("user_a") == 1
+    assert query_cache.get_revision("user_b") == 0
+
+
+def test_category_candidates_cached_per_revision(sample_question):
+    """Category reads are reused until the user's revision changes."""
+    repo = Mock()
+    repo.get_category_candidates.return_value = [(sample_question, 0)]
+
+    query_cache.get_category_candidates(repo, "BHP", "test_user")
+    query_cache.get_category_candidates(repo, "BHP", "test_user")
+    assert repo.get_category_candidates.call_count == 1
+
+    query_cache.bump_revision("test_user")
+    query_cache.get_category_candidates(repo, "BHP", "test_user")
+    assert repo.get_category_candidates.call_count == 2
+
+
+def test_mastery_percentage_cached_per_category():
+    """Mastery is read once per (user, category) until the next write."""
+    repo = Mock()
+    repo.get_mastery_percentage.return_value = 0.5
+
+    query_cache.get_mastery_percentage(repo, "test_user", "BHP")
+    query_cache.get_mastery_percentage(repo, "test_user", "BHP")
+    query_cache.get_mastery_percentage(repo, "test_user", "Law")
+
+    assert repo.get_mastery_percentage.call_count == 2
+
+
+def test_category_stats_cached_until_next_write():
+    """Dashboard reruns reuse the aggregate until the user answers again."""
+    repo = Mock()
+    repo.get_category_stats.return_value = [
+        {"category": "BHP", "total": 10, "mastered": 3}
+    ]
+
+    query_cache.get_category_stats(repo, "test_user")
+    query_cache.get_category_stats(repo, "test_user")
+    assert repo.get_category_stats.call_count == 1
+
+    query_cache.bump_revision("test_user")
+    query_cache.get_category_stats(repo, "test_user")
+    assert repo.get_category_stats.call_count == 2
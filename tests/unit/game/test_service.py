@@ -9,6 +9,7 @@ from src.quiz.domain.models import (
     OptionKey,
     Question,
     QuestionCandidate,
+    QuizSession,
     UserProfile,
 )
 
@@ -62,6 +63,29 @@ class TestDashboardStats:
         assert result["total_mastered"] == 75
         assert result["global_progress"] == 0.5
 
+    def test_get_dashboard_stats_reuses_session_profile(self, service, mock_repo):
+        """Dashboard reruns should not re-fetch the profile from the DB."""
+        mock_repo.get_category_stats.return_value = []
+
+        service.get_dashboard_stats("test_user")
+        service.get_dashboard_stats("test_user")
+
+        assert mock_repo.get_or_create_profile.call_count == 1
+
+    def test_category_payload_built_once_for_same_stats(self, service, mock_repo):
+        """Unchanged stats rows reuse the cached category cards."""
+        mock_repo.get_category_stats.return_value = [
+            {"category": "BHP", "total": 4, "mastered": 1},
+        ]
+
+        with patch("src.game.service.Category.get_icon", return_value="🦺") as get_icon:
+            first = service.get_dashboard_stats("test_user")
+            second = service.get_dashboard_stats("test_user")
+
+        assert get_icon.call_count == 1
+        assert first["categories"] == second["categories"]
+        assert second["categories"][0]["subtitle"] == "1 / 4 Zrobione"
+
 
 class TestDailySprintFlow:
     def test_start_daily_sprint_with_questions(
@@ -80,8 +104,8 @@ class TestDailySprintFlow:
             service.start_daily_sprint("test_user")
 
             assert st.session_state.screen == "quiz"
-            assert st.session_state.quiz_title == "🚀 Codzienny Sprint"
-            assert len(st.session_state.quiz_questions) > 0
+            assert st.session_state.quiz.title == "🚀 Codzienny Sprint"
+            assert len(st.session_state.quiz.questions) > 0
 
 
 class TestCategoryMode:
@@ -95,23 +119,45 @@ class TestCategoryMode:
                 category="BHP",
             )
         ]
-        mock_repo.get_questions_by_category.return_value = questions
+        mock_repo.get_category_candidates.return_value = [(q, 0) for q in questions]
 
         # Don't patch session_state - use the autouse fixture from conftest
         service.start_category_mode("test_user", "BHP")
 
-        mock_repo.get_questions_by_category.assert_called_once()
+        mock_repo.get_category_candidates.assert_called_once()
         assert st.session_state.screen == "quiz"
-        assert st.session_state.quiz_title == "📚 BHP"
+        assert st.session_state.quiz.title == "📚 BHP"
 
     @patch("streamlit.toast")
     def test_start_category_mode_no_questions(self, mock_toast, service, mock_repo):
-        mock_repo.get_questions_by_category.return_value = []
+        mock_repo.get_category_candidates.return_value = []
 
         service.start_category_mode("test_user", "BHP")
 
         mock_toast.assert_called_once()
 
+    def test_start_category_mode_reshuffles_cached_rows(self, service, mock_repo):
+        """Rows are cached, but tie order is re-randomized on every start."""
+        questions = [
+            Question(
+                id=f"Q{i}",
+                text="Test?",
+                options={OptionKey.A: "A"},
+                correct_option=OptionKey.A,
+                category="BHP",
+            )
+            for i in range(20)
+        ]
+        mock_repo.get_category_candidates.return_value = [(q, 0) for q in questions]
+
+        orders = []
+        for _ in range(2):
+            service.start_category_mode("test_user", "BHP")
+            orders.append([q.id for q in st.session_state.quiz.questions])
+
+        mock_repo.get_category_candidates.assert_called_once()
+        assert orders[0] != orders[1]
+
 
 class TestOnboarding:
     def test_start_onboarding_creates_tutorial(self, service, mock_repo):
@@ -123,52 +169,46 @@ class TestOnboarding:
 
         # Verify session state was set correctly
         assert st.session_state.screen == "quiz"
-        assert st.session_state.quiz_title == "🎓 Szkolenie Wstępne"
-        assert len(st.session_state.quiz_questions) == 1
+        assert st.session_state.quiz.title == "🎓 Szkolenie Wstępne"
+        assert len(st.session_state.quiz.questions) == 1
 
 
 class TestAnswerSubmission:
     def test_submit_answer_correct(self, service, mock_repo, sample_question):
         # Initialize session state
-        st.session_state.score = 0
-        st.session_state.answers_history = []
-        st.session_state.quiz_errors = []
-        st.session_state.last_feedback = {}
+        st.session_state.quiz = QuizSession()
 
         service.submit_answer("test_user", sample_question, OptionKey.A)
 
-        assert st.session_state.score == 1
-        assert st.session_state.feedback_mode is True
+        assert st.session_state.quiz.score == 1
+        assert st.session_state.quiz.feedback_mode is True
         mock_repo.save_attempt.assert_called_once_with("test_user", "Q1", True)
 
     def test_submit_answer_incorrect(self, service, mock_repo, sample_question):
-        st.session_state.score = 0
-        st.session_state.answers_history = []
-        st.session_state.quiz_errors = []
-        st.session_state.last_feedback = {}
+        st.session_state.quiz = QuizSession()
 
         service.submit_answer("test_user", sample_question, OptionKey.B)
 
-        assert st.session_state.score == 0
-        assert "Q1" in st.session_state.quiz_errors
+        assert st.session_state.quiz.score == 0
+        assert "Q1" in st.session_state.quiz.errors
         mock_repo.save_attempt.assert_called_once_with("test_user", "Q1", False)
 
 
 class TestQuizNavigation:
     def test_next_question_advances_index(self, service, sample_question):
-        st.session_state.current_index = 0
-        st.session_state.quiz_questions = [sample_question, sample_question]
-        st.session_state.feedback_mode = True
+        st.session_state.quiz = QuizSession(
+            questions=(sample_question, sample_question), feedback_mode=True
+        )
 
         service.next_question()
 
-        assert st.session_state.current_index == 1
-        assert st.session_state.feedback_mode is False
+        assert st.session_state.quiz.current_index == 1
+        assert st.session_state.quiz.feedback_mode is False
 
     def test_next_question_finishes_quiz(self, service, sample_question):
-        st.session_state.current_index = 14
-        st.session_state.quiz_questions = [sample_question] * 15
-        st.session_state.feedback_mode = True
+        st.session_state.quiz = QuizSession(
+            questions=(sample_question,) * 15, current_index=14, feedback_mode=True
+        )
 
         service.next_question()
 
@@ -184,3 +224,14 @@ class TestLanguageUpdate:
         # Should fetch profile and save with new language
         assert mock_repo.get_or_create_profile.called
         assert mock_repo.save_profile.called
+
+    def test_update_language_same_language_skips_rerun(self, service, mock_repo):
+        mock_repo.get_or_create_profile.return_value = UserProfile(
+            user_id="test_user", preferred_language=Language.EN
+        )
+
+        with patch("streamlit.rerun") as mock_rerun:
+            service.update_language("test_user", "en")
+
+        mock_rerun.assert_not_called()
+        mock_repo.save_profile.assert_not_called()
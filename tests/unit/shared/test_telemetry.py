@@ -0,0 +1,98 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.shared import telemetry
+from src.shared.telemetry import (
+    METRICS_PORT_ENV,
+    get_method_duration,
+    start_metrics_server,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics_state(monkeypatch):
+    """The histogram is created lazily once per process; start each test fresh."""
+    monkeypatch.setattr(telemetry, "_method_duration", None)
+    monkeypatch.setattr(telemetry, "_metrics_configured", False)
+
+
+class TestMetricsDisabled:
+    def test_no_histogram_without_port(self, monkeypatch):
+        monkeypatch.delenv(METRICS_PORT_ENV, raising=False)
+
+        with patch("prometheus_client.Histogram") as histogram:
+            assert get_method_duration() is None
+            assert get_method_duration() is None
+
+        histogram.assert_not_called()
+
+    def test_server_not_started_without_port(self, monkeypatch):
+        monkeypatch.delenv(METRICS_PORT_ENV, raising=False)
+
+        with patch("prometheus_client.start_http_server") as start:
+            assert start_metrics_server() is False
+
+        start.assert_not_called()
+
+
+class TestMetricsEnabled:
+    def test_histogram_created_once(self, monkeypatch):
+        monkeypatch.setenv(METRICS_PORT_ENV, "9464")
+
+        first = get_method_duration()
+        second = get_method_duration()
+
+        assert first is not None
+        assert first is second
+
+    def test_concurrent_first_calls_all_get_the_histogram(self, monkeypatch):
+        """No thread may see the 'configured' flag before the histogram exists."""
+        monkeypatch.setenv(METRICS_PORT_ENV, "9464")
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(get_method_duration()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 8
+        assert results[0] is not None
+        assert all(r is results[0] for r in results)
+
+    def test_timed_call_does_not_start_server(self, monkeypatch):
+        """Binding the port is left to bootstrap, never a user request."""
+        monkeypatch.setenv(METRICS_PORT_ENV, "9464")
+
+        with patch("prometheus_client.start_http_server") as start:
+            get_method_duration()
+
+        start.assert_not_called()
+
+    def test_server_started_on_configured_port(self, monkeypatch):
+        monkeypatch.setenv(METRICS_PORT_ENV, "9464")
+
+        with patch("prometheus_client.start_http_server") as start:
+            assert start_metrics_server() is True
+
+        start.assert_called_once_with(9464)
+
+    def test_bind_failure_is_logged(self, monkeypatch):
+        monkeypatch.setenv(METRICS_PORT_ENV, "9464")
+
+        with (
+            patch(
+                "prometheus_client.start_http_server",
+                side_effect=OSError("Address already in use"),
+            ),
+            patch.object(telemetry.Telemetry, "log_error") as log_error,
+        ):
+            assert start_metrics_server() is False
+
+        log_error.assert_called_once()
+        assert log_error.call_args.kwargs["port"] == "9464"
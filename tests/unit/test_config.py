@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from src.config import Category, GameConfig
+from src.config import Category, GameConfig, _image_data_uri, _logo_exists
 
 
 class TestCategory:
@@ -111,6 +111,15 @@ class TestGameConfig:
             path = GameConfig.get_demo_logo_path("nonexistent-company")
             assert path == GameConfig.APP_LOGO_PATH
 
+    def test_get_demo_logo_path_checks_disk_once(self):
+        """Repeated lookups for the same slug should stat the file only once."""
+        _logo_exists.cache_clear()
+        with patch("src.config.os.path.exists", return_value=True) as exists:
+            GameConfig.get_demo_logo_path("cached-company")
+            GameConfig.get_demo_logo_path("cached-company")
+
+        assert exists.call_count == 1
+
     def test_get_image_base64_handles_urls(self):
         """get_image_base64() should pass through HTTP URLs."""
         url = "https://example.com/image.png"
@@ -123,3 +132,15 @@ class TestGameConfig:
         assert result.startswith("data:image/png;base64,")
         # Should be the 1x1 transparent pixel fallback
         assert "iVBORw0KGgo" in result
+
+    def test_get_image_base64_encodes_file_once(self, tmp_path):
+        """A local logo is read once; later calls reuse the cached data URI."""
+        _image_data_uri.cache_clear()
+        logo = tmp_path / "logo.JPG"
+        logo.write_bytes(b"jpeg-bytes")
+
+        first = GameConfig.get_image_base64(str(logo))
+        logo.unlink()
+        second = GameConfig.get_image_base64(str(logo))
+
+        assert first == second == "data:image/jpeg;base64,anBlZy1ieXRlcw=="